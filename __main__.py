@@ -67,6 +67,8 @@ def graceful_shutdown(web_session_manager=None):
     # Clear the access/reset Token tables if the server is being shutdown.
     clear_temporary_tables()
     LoggingManager().log(LoggingManager.LogLevel.LOG_INFO, f'The application has closed.\n{"#" * 140}', origin=LOG_ORIGIN_SHUTDOWN, no_print=False)
+    # Write any queued log records to the log files before the application exits.
+    LoggingManager().shutdown()
 
 
 def handle_interrupt():
@@ -12,22 +12,26 @@ class ConfigManager:
     :raises RuntimeError: If any of the parameters passed through to the constructor is invalid.
     """
 
+    # The config manager holds no per-instance state, so instances are created without an attribute dictionary.
+    __slots__ = ()
     _instance = None
     __config = None
 
     def __new__(cls, config_path: str = None):
-        if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-            if cls.__config is None:
-                cls.__config = configparser.ConfigParser()
-                if config_path and os.path.exists(config_path):
-                    cls.__config.read(config_path)
-                else:
-                    raise RuntimeError(f"Config Manager Error [Error Code: {ERR_CONFIG_MNGR_INCORRECT_PARAMS}]\n"
-                                       "One or more parameters provided to start the service was null!\n"
-                                       "Please check the server config file exists and the path provided is correct.\n "
-                                       "If you are a server administrator, please refer to the software manual!")
-        return cls.instance()
+        # Return the existing instance directly, since the config manager is retrieved on nearly every request.
+        if cls._instance is not None:
+            return cls._instance
+        cls._instance = super(ConfigManager, cls).__new__(cls)
+        if cls.__config is None:
+            cls.__config = configparser.ConfigParser()
+            if config_path and os.path.exists(config_path):
+                cls.__config.read(config_path)
+            else:
+                raise RuntimeError(f"Config Manager Error [Error Code: {ERR_CONFIG_MNGR_INCORRECT_PARAMS}]\n"
+                                   "One or more parameters provided to start the service was null!\n"
+                                   "Please check the server config file exists and the path provided is correct.\n "
+                                   "If you are a server administrator, please refer to the software manual!")
+        return cls._instance
 
     @classmethod
     def instance(cls):
@@ -5,22 +5,31 @@ that require creating, reading, updating, or deleting data from the database ser
 must use this interface module.
 """
 
+import os
+import asyncio
+import hashlib
+from functools import partial, lru_cache
+from collections import OrderedDict
 from datetime import datetime, timedelta, date
 from typing import Dict, List
+import orjson
 import pdfkit
+from pdfkit.configuration import Configuration
 import csv
 from io import StringIO
+from tempfile import TemporaryDirectory
+from types import MappingProxyType
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import or_
+from sqlalchemy import or_, func
 from fastapi import HTTPException, status
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 
 from server.lib.logging_manager import LoggingManager
 from server.lib.config_manager import ConfigManager
 from server.lib.utils.email_utils import send_email
 from server.lib.data_models.report import PydanticLeaveRequest
-from server.lib.utils.date_utils import check_date_formats
+from server.lib.utils.date_utils import check_date_formats, DATE_FORMAT
 from server.lib.data_models.student import Student
 from server.lib.data_models.student_care_hours import StudentCareHours
 from server.lib.data_models.student_grade import StudentGrade
@@ -28,14 +37,123 @@ from server.lib.data_models.employee_role import EmployeeRole
 from server.lib.data_models.employee import Employee
 from server.lib.data_models.employee_hours import EmployeeHours
 from server.lib.database_manager import get_db_session
-from server.lib.strings import ROOT_DIR, LOG_ORIGIN_API
+from server.lib.strings import ROOT_DIR, TEMPLATE_CACHE_DIR, LOG_ORIGIN_API
 
+# The template bytecode cache directory is only accessible by the server user, since cached bytecode is executed when loaded.
+os.makedirs(TEMPLATE_CACHE_DIR, mode=0o700, exist_ok=True)
 # Initializes the file system loader environment for the report generation library.
+# The compiled template bytecode is cached on disk, and templates are not reloaded since they don't change while the server is running.
 env = Environment(loader=FileSystemLoader(
     [
         f'{ROOT_DIR}/lib/report_generation'
     ]
-))
+), bytecode_cache=FileSystemBytecodeCache(directory=TEMPLATE_CACHE_DIR), auto_reload=False)
+# The report templates are compiled once when the module is loaded and reused for every generated report.
+timesheet_report_template = env.get_template('timesheet_report_template.html')
+childcare_report_template = env.get_template('childcare_report_template.html')
+report_templates = {template.name: template for template in (timesheet_report_template, childcare_report_template)}
+# The wkhtmltopdf options used for every generated PDF report, these are read-only since they are shared by every render.
+# The report stylesheet is not passed to wkhtmltopdf, since it is included directly in the report templates.
+pdf_options = MappingProxyType({
+    'page-size': 'Letter',
+    'margin-top': '0.5in',
+    'margin-right': '0.5in',
+    'margin-bottom': '0.5in',
+    'margin-left': '0.5in',
+    'dpi': 300,
+    'encoding': 'UTF-8',
+    'no-outline': None,
+    'quiet': None
+})
+# The most recently generated PDF reports, keyed by a hash of the report template and template variables.
+# Reports generated again with unchanged data are returned from this cache without invoking wkhtmltopdf.
+REPORT_CACHE_SIZE = 16
+report_cache = OrderedDict()
+# The maximum number of rows rendered into a single report document, larger reports are split into multiple sections.
+REPORT_CHUNK_SIZE = 200
+
+
+@lru_cache(maxsize=None)
+def get_pdf_configuration() -> Configuration:
+    """
+    This utility method retrieves and caches the pdfkit configuration that points to the wkhtmltopdf executable.
+    Without a cached configuration, pdfkit searches for the wkhtmltopdf executable in a subprocess for every generated report.
+
+    :return: The pdfkit configuration used to generate PDF reports.
+    :rtype: pdfkit.configuration.Configuration
+    """
+    return pdfkit.configuration()
+
+
+def render_pdf_reports(template_name: str, template_vars_list: List[Dict[str, any]]) -> bytes:
+    """
+    This utility method renders the provided report template once for each set of provided template variables,
+    and converts all the rendered HTML documents into a single PDF document with a single wkhtmltopdf invocation.
+    Each rendered report starts on a new page in the PDF document.
+    The HTML documents are streamed to temporary files so that large reports are never held in memory as a single string.
+    This method is blocking and is executed in the default thread pool by the report methods.
+
+    :param template_name: The file name of the report template to render.
+    :type template_name: str, required
+    :param template_vars_list: A list of the variables used to render each report.
+    :type template_vars_list: List[Dict[str, any]], required
+    :return: Returns a byte-string containing all the rendered PDF reports.
+    :rtype: bytes
+    """
+    with TemporaryDirectory() as temp_dir:
+        html_paths = []
+        for index, template_vars in enumerate(template_vars_list):
+            html_path = f"{temp_dir}/{index}_{template_name}"
+            html_stream = report_templates[template_name].stream(template_vars)
+            html_stream.enable_buffering(64)
+            html_stream.dump(html_path, encoding='utf-8')
+            html_paths.append(html_path)
+        return pdfkit.from_file(html_paths, options=pdf_options, configuration=get_pdf_configuration())
+
+
+def split_report_vars(template_vars: Dict[str, any], list_key: str, chunk_size: int = REPORT_CHUNK_SIZE) -> List[Dict[str, any]]:
+    """
+    This utility method splits the rows of a report into multiple sets of template variables with at most ``chunk_size`` rows each.
+    Each set of template variables is rendered as a separate section of the PDF report, since wkhtmltopdf lays out
+    very long tables considerably slower than multiple shorter tables.
+
+    :param template_vars: The variables used to render the report template.
+    :type template_vars: Dict[str, any], required
+    :param list_key: The name of the template variable that holds the rows of the report. (Example: time_sheet_list)
+    :type list_key: str, required
+    :param chunk_size: The maximum number of rows in each section of the report.
+    :type chunk_size: int, optional
+    :return: A list of the template variables for each section of the report.
+    :rtype: List[Dict[str, any]]
+    """
+    rows = template_vars[list_key]
+    if len(rows) <= chunk_size:
+        return [template_vars]
+    return [{**template_vars, list_key: rows[index:index + chunk_size]} for index in range(0, len(rows), chunk_size)]
+
+
+async def render_cached_pdf_report(template_name: str, template_vars_list: List[Dict[str, any]]) -> bytes:
+    """
+    This utility method renders the provided report template into a PDF report in the default thread pool,
+    or returns the previously rendered PDF report if the same report was already rendered with identical template variables.
+
+    :param template_name: The file name of the report template to render.
+    :type template_name: str, required
+    :param template_vars_list: A list of the variables used to render each section of the report.
+    :type template_vars_list: List[Dict[str, any]], required
+    :return: Returns a byte-string containing the rendered PDF report.
+    :rtype: bytes
+    """
+    report_hash = hashlib.blake2b(orjson.dumps([template_name, template_vars_list], option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+    if report_hash in report_cache:
+        report_cache.move_to_end(report_hash)
+        return report_cache[report_hash]
+    # Render the PDF report in the default thread pool to avoid blocking the event loop, wkhtmltopdf already runs in its own process.
+    pdf_bytes = await asyncio.get_running_loop().run_in_executor(None, render_pdf_reports, template_name, template_vars_list)
+    report_cache[report_hash] = pdf_bytes
+    if len(report_cache) > REPORT_CACHE_SIZE:
+        report_cache.popitem(last=False)
+    return pdf_bytes
 
 
 async def get_all_time_sheets_for_report(start_date: str, end_date: str, session: Session = None) -> Dict[str, any]:
@@ -58,39 +176,48 @@ async def get_all_time_sheets_for_report(start_date: str, end_date: str, session
     if session is None:
         session = next(get_db_session())
     try:
-        # Retrieve all the employees that submitted time sheets during the provided reporting period,
+        # Retrieve the total timesheet hours of all the employees that submitted time sheets during the provided reporting period,
         # however, ignore the default admin account if it is included and ignore timesheet records with 0-hour entries.
-        # In addition, order the employee timesheet records by the employee last name.
-        employee_time_sheet_records = session.query(Employee, EmployeeHours, EmployeeRole).filter(
+        # The timesheet hours are accumulated by the database, and the employee totals are ordered by the employee last name.
+        employee_time_sheet_totals = session.query(
+            Employee.EmployeeID,
+            Employee.FirstName,
+            Employee.LastName,
+            func.sum(EmployeeHours.WorkHours),
+            func.sum(EmployeeHours.PTOHours),
+            func.sum(EmployeeHours.ExtraHours)
+        ).filter(
             Employee.EmployeeEnabled == 1,
             Employee.EmployeeID != 'admin',
             EmployeeRole.id == Employee.EmployeeRoleID,
             EmployeeHours.EmployeeID == Employee.EmployeeID,
             EmployeeHours.DateWorked.between(start_date, end_date),
             or_(EmployeeHours.WorkHours > 0, EmployeeHours.PTOHours > 0, EmployeeHours.ExtraHours > 0)
-        ).order_by(Employee.LastName).all()
-        if employee_time_sheet_records is None:
+        ).group_by(Employee.EmployeeID, Employee.FirstName, Employee.LastName).order_by(Employee.LastName).all()
+        if employee_time_sheet_totals is None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Encountered an error retrieving employee time sheets!")
 
         # Define the data dictionary that will be used to hold the timesheet hours and comments for each employee that submitted time sheets
         # over the reporting period.
         all_employees_hours = {}
-        for record in employee_time_sheet_records:
-            all_employees_hours[record[0].EmployeeID] = {
-                "full_name": f"{record[0].FirstName.capitalize()} {record[0].LastName.capitalize()}",
-                "work_hours": 0,
-                "pto_hours": 0,
-                "extra_hours": 0,
+        for employee_id, first_name, last_name, work_hours, pto_hours, extra_hours in employee_time_sheet_totals:
+            all_employees_hours[employee_id] = {
+                "full_name": f"{first_name.capitalize()} {last_name.capitalize()}",
+                "work_hours": work_hours,
+                "pto_hours": pto_hours,
+                "extra_hours": extra_hours,
                 "comments": []
             }
 
-        # For each employee timesheet record, accumulate the total work hours, pto hours, and extra hours for each employee.
-        for record in employee_time_sheet_records:
-            all_employees_hours[record[0].EmployeeID]["work_hours"] += record[1].WorkHours
-            all_employees_hours[record[0].EmployeeID]["pto_hours"] += record[1].PTOHours
-            all_employees_hours[record[0].EmployeeID]["extra_hours"] += record[1].ExtraHours
-            if record[1].Comment and len(record[1].Comment) > 0:
-                all_employees_hours[record[0].EmployeeID]["comments"].append({"date": datetime.strftime(record[1].DateWorked, '%Y-%m-%d'), "comment": record[1].Comment})
+        # Retrieve only the timesheet records with submission comments to attach the comments to each employee.
+        employee_time_sheet_comments = session.query(EmployeeHours.EmployeeID, EmployeeHours.DateWorked, EmployeeHours.Comment).filter(
+            EmployeeHours.EmployeeID.in_(all_employees_hours.keys()),
+            EmployeeHours.DateWorked.between(start_date, end_date),
+            EmployeeHours.Comment != "",
+            or_(EmployeeHours.WorkHours > 0, EmployeeHours.PTOHours > 0, EmployeeHours.ExtraHours > 0)
+        ).order_by(EmployeeHours.DateWorked).all() if all_employees_hours else []
+        for employee_id, date_worked, comment in employee_time_sheet_comments:
+            all_employees_hours[employee_id]["comments"].append({"date": datetime.strftime(date_worked, DATE_FORMAT), "comment": comment})
 
         session.commit()
     except IntegrityError as err:
@@ -386,57 +513,57 @@ async def create_time_sheets_report(start_date: str, end_date: str, session: Ses
     :return: Returns a byte-string containing all the employee timesheet records over the provided range of work dates.
     :rtype: bytes
     """
+    if session is None:
+        session = next(get_db_session())
+    template_vars = await get_time_sheets_report_vars(start_date, end_date, session)
+    pdf_bytes = await render_cached_pdf_report(timesheet_report_template.name, split_report_vars(template_vars, 'time_sheet_list'))
+    LoggingManager().log(LoggingManager.LogLevel.LOG_INFO,
+                         f"A timesheet PDF report was generated for the reporting period: {start_date} - {end_date}.",
+                         origin=LOG_ORIGIN_API, no_print=False)
+    return pdf_bytes
+
+
+async def get_time_sheets_report_vars(start_date: str, end_date: str, session: Session = None) -> Dict[str, any]:
+    """
+    This utility method retrieves all the employee timesheet records that were submitted over the provided range of work dates,
+    and formats them into the template variables used to render an employee timesheet PDF report.
+
+    :param start_date: The start work date for the range of employee timesheet records to retrieve.
+    :type start_date: str, required
+    :param end_date: The end work date for the range of employee timesheet records to retrieve.
+    :type end_date: str, required
+    :param session: The database session that is used to retrieve all employee timesheet records over the provided range of work dates.
+    :type session: Session, optional
+    :return: A dictionary containing the template variables used to render the employee timesheet report template.
+    :rtype: Dict[str, any]
+    :raises RuntimeError: If the start or end dates of the reporting period are invalid.
+    """
     if session is None:
         session = next(get_db_session())
     if not check_date_formats([start_date, end_date]):
         raise RuntimeError("The start and end dates for the reporting period are invalid!")
-    date_time_start_repr = datetime.strptime(start_date, '%Y-%m-%d')
-    date_time_end_repr = datetime.strptime(end_date, '%Y-%m-%d')
+    date_time_start_repr = datetime.strptime(start_date, DATE_FORMAT)
+    date_time_end_repr = datetime.strptime(end_date, DATE_FORMAT)
+
+    # Format the reporting period dates once, since they are used in multiple template variables.
+    reporting_period_start = date_time_start_repr.strftime('%m/%d/%Y')
+    reporting_period_end = date_time_end_repr.strftime('%m/%d/%Y')
 
-    template = env.get_template(f'timesheet_report_template.html')
     template_vars = {
-        "title": f"Employee Timesheet Report - [{datetime.strftime(date_time_start_repr, '%m/%d/%Y')} - {datetime.strftime(date_time_end_repr, '%m/%d/%Y')}]",
-        "reporting_period_start": datetime.strftime(date_time_start_repr, '%m/%d/%Y'),
-        "reporting_period_end": datetime.strftime(date_time_end_repr, '%m/%d/%Y'),
+        "title": f"Employee Timesheet Report - [{reporting_period_start} - {reporting_period_end}]",
+        "reporting_period_start": reporting_period_start,
+        "reporting_period_end": reporting_period_end,
         "reporting_period_text": f"{date_time_start_repr.strftime('%B')} {date_time_start_repr.year}",
         "footer_text": f"This document was automatically generated by the reporting module of the PCA Timesheet and Student Care server.<br>"
                        f"<b>Providence Christian Academy - {date_time_start_repr.year}</b>",
         "time_sheet_list": []
     }
     all_employee_hours = await get_all_time_sheets_for_report(start_date, end_date, session)
-    time_sheet_list = []
-    for employee_id in all_employee_hours.keys():
-        time_sheet_list.append(
-            [
-                employee_id,
-                all_employee_hours[employee_id]['full_name'],
-                all_employee_hours[employee_id]['work_hours'],
-                all_employee_hours[employee_id]['pto_hours'],
-                all_employee_hours[employee_id]['extra_hours'],
-                all_employee_hours[employee_id]['comments']
-            ]
-        )
-    template_vars["time_sheet_list"] = time_sheet_list
-    html_out = template.render(template_vars)
-    options = {
-        'page-size': 'Letter',
-        'margin-top': '0.5in',
-        'margin-right': '0.5in',
-        'margin-bottom': '0.5in',
-        'margin-left': '0.5in',
-        'dpi': 300,
-        'encoding': 'UTF-8',
-        'no-outline': None
-    }
-    pdf_bytes = pdfkit.from_string(html_out,
-                                   css=[
-                                       f"{ROOT_DIR}/lib/report_generation/styles.css"
-                                   ],
-                                   options=options)
-    LoggingManager().log(LoggingManager.LogLevel.LOG_INFO,
-                         f"A timesheet PDF report was generated for the reporting period: {start_date} - {end_date}.",
-                         origin=LOG_ORIGIN_API, no_print=False)
-    return pdf_bytes
+    template_vars["time_sheet_list"] = [
+        [employee_id, hours['full_name'], hours['work_hours'], hours['pto_hours'], hours['extra_hours'], hours['comments']]
+        for employee_id, hours in all_employee_hours.items()
+    ]
+    return template_vars
 
 
 async def create_student_care_report(start_date, end_date, grade, session) -> bytes:
@@ -460,14 +587,17 @@ async def create_student_care_report(start_date, end_date, grade, session) -> by
     if not check_date_formats([start_date, end_date]):
         raise RuntimeError("The start and end dates for the reporting period are invalid!")
     grade = grade.lower().strip()
-    date_time_start_repr = datetime.strptime(start_date, '%Y-%m-%d')
-    date_time_end_repr = datetime.strptime(end_date, '%Y-%m-%d')
+    date_time_start_repr = datetime.strptime(start_date, DATE_FORMAT)
+    date_time_end_repr = datetime.strptime(end_date, DATE_FORMAT)
+
+    # Format the reporting period dates once, since they are used in multiple template variables.
+    reporting_period_start = date_time_start_repr.strftime('%m/%d/%Y')
+    reporting_period_end = date_time_end_repr.strftime('%m/%d/%Y')
 
-    template = env.get_template('childcare_report_template.html')
     template_vars = {
-        "title": f"Student Care Service Report - [{datetime.strftime(date_time_start_repr, '%m/%d/%Y')} - {datetime.strftime(date_time_end_repr, '%m/%d/%Y')}]",
-        "reporting_period_start": datetime.strftime(date_time_start_repr, '%m/%d/%Y'),
-        "reporting_period_end": datetime.strftime(date_time_end_repr, '%m/%d/%Y'),
+        "title": f"Student Care Service Report - [{reporting_period_start} - {reporting_period_end}]",
+        "reporting_period_start": reporting_period_start,
+        "reporting_period_end": reporting_period_end,
         "reporting_period_text": f"{date_time_start_repr.strftime('%B')} {date_time_start_repr.year}",
         "footer_text": f"This document was automatically generated by the reporting module of the PCA Timesheet and Student Care server.<br>"
                        f"<b>Providence Christian Academy - {date_time_start_repr.year}</b>",
@@ -486,22 +616,7 @@ async def create_student_care_report(start_date, end_date, grade, session) -> by
             ]
         )
     template_vars["care_service_list"] = time_sheet_list
-    html_out = template.render(template_vars)
-    options = {
-        'page-size': 'Letter',
-        'margin-top': '0.5in',
-        'margin-right': '0.5in',
-        'margin-bottom': '0.5in',
-        'margin-left': '0.5in',
-        'dpi': 300,
-        'encoding': 'UTF-8',
-        'no-outline': None
-    }
-    pdf_bytes = pdfkit.from_string(html_out,
-                                   css=[
-                                       f"{ROOT_DIR}/lib/report_generation/styles.css"
-                                   ],
-                                   options=options)
+    pdf_bytes = await render_cached_pdf_report(childcare_report_template.name, split_report_vars(template_vars, 'care_service_list'))
     LoggingManager().log(LoggingManager.LogLevel.LOG_INFO,
                          f"A student care service PDF report was generated for the reporting period: {start_date} - {end_date}.",
                          origin=LOG_ORIGIN_API, no_print=False)
@@ -526,36 +641,38 @@ async def create_leave_request_email(leave_request: PydanticLeaveRequest, sessio
     if not check_date_formats([leave_request.date_of_absence_start, leave_request.date_of_absence_end]):
         raise RuntimeError("The start and end dates for the reporting period are invalid!")
     mailing_address = ConfigManager().config()['System Settings']['leave_request_mailing_address'].strip()
-    formatted_start_date = datetime.strptime(leave_request.date_of_absence_start, "%Y-%m-%d").strftime("%m/%d/%Y")
-    formatted_end_date = datetime.strptime(leave_request.date_of_absence_end, "%Y-%m-%d").strftime("%m/%d/%Y")
+    formatted_start_date = datetime.strptime(leave_request.date_of_absence_start, DATE_FORMAT).strftime("%m/%d/%Y")
+    formatted_end_date = datetime.strptime(leave_request.date_of_absence_end, DATE_FORMAT).strftime("%m/%d/%Y")
 
     matching_employee = session.query(Employee).filter(
         Employee.EmployeeID == leave_request.employee_id,
     ).first()
     if matching_employee is None:
         raise RuntimeError("The leave request could not be sent because the provided employee ID does not match any employee records!")
-    sent_email = send_email(
-                    to_user=f"Leave Request for {leave_request.employee_name}:",
-                    to_email=mailing_address,
-                    subj=f"New Leave Request - {leave_request.employee_name}",
-                    messages=[
-                        "<hr>",
-                        f"<b>Employee ID:</b> {leave_request.employee_id}",
-                        f"<b>Employee Name:</b> {leave_request.employee_name}",
-                        "<hr>",
-                        f"<b>Current Date</b>: {leave_request.current_date}",
-                        f"<b>Absence From</b>: {formatted_start_date} to {formatted_end_date}",
-                        f"<b># of full days</b>: {leave_request.num_full_days}",
-                        f"<b># of half days</b>: {leave_request.num_half_days}",
-                        f"<b># of hours</b>: {leave_request.num_hours}",
-                        "<hr>",
-                        f"<b>Absence Reason</b>: {', '.join(leave_request.absence_reason_list)}",
-                        f"<b>Who will cover</b>: {leave_request.absence_cover_text}",
-                        f"<b>Comments:</b> {leave_request.absence_comments}"
-                    ],
-                    template="leave_request_email_template.html",
-                    to_cc=matching_employee.EmployeeContactInfo.PrimaryEmail
-                )
+    # Send the email in a worker thread, so that the SmarterMail API requests do not block the event loop.
+    sent_email = await asyncio.get_running_loop().run_in_executor(None, partial(
+        send_email,
+        to_user=f"Leave Request for {leave_request.employee_name}:",
+        to_email=mailing_address,
+        subj=f"New Leave Request - {leave_request.employee_name}",
+        messages=[
+            "<hr>",
+            f"<b>Employee ID:</b> {leave_request.employee_id}",
+            f"<b>Employee Name:</b> {leave_request.employee_name}",
+            "<hr>",
+            f"<b>Current Date</b>: {leave_request.current_date}",
+            f"<b>Absence From</b>: {formatted_start_date} to {formatted_end_date}",
+            f"<b># of full days</b>: {leave_request.num_full_days}",
+            f"<b># of half days</b>: {leave_request.num_half_days}",
+            f"<b># of hours</b>: {leave_request.num_hours}",
+            "<hr>",
+            f"<b>Absence Reason</b>: {', '.join(leave_request.absence_reason_list)}",
+            f"<b>Who will cover</b>: {leave_request.absence_cover_text}",
+            f"<b>Comments:</b> {leave_request.absence_comments}"
+        ],
+        template="leave_request_email_template.html",
+        to_cc=matching_employee.EmployeeContactInfo.PrimaryEmail
+    ))
     if sent_email:
         LoggingManager().log(LoggingManager.LogLevel.LOG_INFO,
                              f"A leave request was created by: {matching_employee.EmployeeID} and has been emailed to administration",
@@ -15,7 +15,7 @@ from fastapi import HTTPException, status
 
 from server.lib.logging_manager import LoggingManager
 from server.lib.strings import LOG_ORIGIN_API
-from server.lib.utils.email_utils import send_email
+from server.lib.utils.email_utils import send_bulk_email
 from server.lib.data_models.student_grade import StudentGrade
 from server.lib.config_manager import ConfigManager
 from server.lib.data_models.student import Student
@@ -357,20 +357,14 @@ async def check_in_student(pyd_student_checkin: PydanticStudentCareHoursCheckIn,
     student_record = session.query(Student).filter(Student.StudentID == pyd_student_checkin.student_id).first()
     care_type_text = "Before-Care Services" if not pyd_student_checkin.care_type else "After-Care Services"
     if student_record:
+        recipients = []
         if student_record.StudentContactInfo.EnablePrimaryEmailNotifications:
-            send_email(
-                to_user=f'{student_record.StudentContactInfo.ParentOneFirstName} {student_record.StudentContactInfo.ParentOneLastName}',
-                to_email=[student_record.StudentContactInfo.PrimaryEmail],
-                subj=f"Student Checked In To {care_type_text}",
-                messages=[
-                    f"<b>{student_record.FirstName.capitalize()} {student_record.LastName.capitalize()}</b> has been checked in to {care_type_text} by {pyd_student_checkin.check_in_signature}.",
-                    f"If you're not aware of your student being checked in to {care_type_text} today, then please contact administration."
-                ],
-            )
+            recipients.append((f'{student_record.StudentContactInfo.ParentOneFirstName} {student_record.StudentContactInfo.ParentOneLastName}', student_record.StudentContactInfo.PrimaryEmail))
         if student_record.StudentContactInfo.EnableSecondaryEmailNotifications:
-            send_email(
-                to_user=f'{student_record.StudentContactInfo.ParentTwoFirstName} {student_record.StudentContactInfo.ParentTwoLastName}',
-                to_email=[student_record.StudentContactInfo.SecondaryEmail],
+            recipients.append((f'{student_record.StudentContactInfo.ParentTwoFirstName} {student_record.StudentContactInfo.ParentTwoLastName}', student_record.StudentContactInfo.SecondaryEmail))
+        if recipients:
+            send_bulk_email(
+                recipients=recipients,
                 subj=f"Student Checked In To {care_type_text}",
                 messages=[
                     f"<b>{student_record.FirstName.capitalize()} {student_record.LastName.capitalize()}</b> has been checked in to {care_type_text} by {pyd_student_checkin.check_in_signature}.",
@@ -443,20 +437,14 @@ async def check_out_student(pyd_student_checkout: PydanticStudentCareHoursCheckO
     student_record = session.query(Student).filter(Student.StudentID == pyd_student_checkout.student_id).first()
     care_type_text = "Before-Care Services" if not pyd_student_checkout.care_type else "After-Care Services"
     if student_record:
+        recipients = []
         if student_record.StudentContactInfo.EnablePrimaryEmailNotifications:
-            send_email(
-                to_user=f'{student_record.StudentContactInfo.ParentOneFirstName} {student_record.StudentContactInfo.ParentOneLastName}',
-                to_email=[student_record.StudentContactInfo.PrimaryEmail],
-                subj=f"Student Checked Out Of {care_type_text}",
-                messages=[
-                    f"<b>{student_record.FirstName.capitalize()} {student_record.LastName.capitalize()}</b> has been checked out of {care_type_text} by {student_care.CheckOutSignature}.",
-                    f"If you're not aware of your student being checked out of {care_type_text} today, then please contact administration."
-                ],
-            )
+            recipients.append((f'{student_record.StudentContactInfo.ParentOneFirstName} {student_record.StudentContactInfo.ParentOneLastName}', student_record.StudentContactInfo.PrimaryEmail))
         if student_record.StudentContactInfo.EnableSecondaryEmailNotifications:
-            send_email(
-                to_user=f'{student_record.StudentContactInfo.ParentTwoFirstName} {student_record.StudentContactInfo.ParentTwoLastName}',
-                to_email=[student_record.StudentContactInfo.SecondaryEmail],
+            recipients.append((f'{student_record.StudentContactInfo.ParentTwoFirstName} {student_record.StudentContactInfo.ParentTwoLastName}', student_record.StudentContactInfo.SecondaryEmail))
+        if recipients:
+            send_bulk_email(
+                recipients=recipients,
                 subj=f"Student Checked Out Of {care_type_text}",
                 messages=[
                     f"<b>{student_record.FirstName.capitalize()} {student_record.LastName.capitalize()}</b> has been checked out of {care_type_text} by {student_care.CheckOutSignature}.",
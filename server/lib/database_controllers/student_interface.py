@@ -11,7 +11,7 @@ from typing import Dict, List
 from server.lib.logging_manager import LoggingManager
 from server.lib.strings import LOG_ORIGIN_API
 from server.lib.data_models.student_care_hours import StudentCareHours
-from server.lib.utils.email_utils import send_email
+from server.lib.utils.email_utils import send_bulk_email
 from server.lib.data_models.student_grade import StudentGrade
 from server.lib.database_manager import get_db_session
 from server.lib.data_models.student_contact_info import StudentContactInfo
@@ -110,22 +110,14 @@ async def create_student(pyd_student: PydanticStudentRegistration, session: Sess
         session.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err)) from err
     # Send notification to enabled emails that the account has been created.
+    recipients = []
     if new_student.StudentContactInfo.EnablePrimaryEmailNotifications:
-        send_email(
-            to_user=f'{new_student.StudentContactInfo.ParentOneFirstName} {new_student.StudentContactInfo.ParentOneLastName}',
-            to_email=[new_student.StudentContactInfo.PrimaryEmail],
-            subj="New Student Registration Confirmed",
-            messages=["Your student's account has been created!",
-                      "Your student's information is provided below:",
-                      f"<b>Student Name:</b> {new_student.FirstName.title()} {new_student.LastName.title()}",
-                      f"<b>Student ID:</b> {new_student.StudentID}",
-                      "<b>Please remember the Student ID as this will be used to check-in/check-out your student from before/after-care services.</b>",
-                      "If any of the information provided is incorrect, please contact PCA administration to make corrections."]
-        )
+        recipients.append((f'{new_student.StudentContactInfo.ParentOneFirstName} {new_student.StudentContactInfo.ParentOneLastName}', new_student.StudentContactInfo.PrimaryEmail))
     if new_student.StudentContactInfo.EnableSecondaryEmailNotifications:
-        send_email(
-            to_user=f'{new_student.StudentContactInfo.ParentTwoFirstName} {new_student.StudentContactInfo.ParentTwoLastName}',
-            to_email=[new_student.StudentContactInfo.SecondaryEmail],
+        recipients.append((f'{new_student.StudentContactInfo.ParentTwoFirstName} {new_student.StudentContactInfo.ParentTwoLastName}', new_student.StudentContactInfo.SecondaryEmail))
+    if recipients:
+        send_bulk_email(
+            recipients=recipients,
             subj="New Student Registration Confirmed",
             messages=["Your student's account has been created!",
                       "Your student's information is provided below:",
@@ -250,20 +242,14 @@ async def update_student(student_id: str, pyd_student_update: PydanticStudentUpd
                          f"The following student account had its information updated: {student.StudentID}.",
                          origin=LOG_ORIGIN_API, no_print=False)
     # Send notification to enabled emails that the account has been created.
+    recipients = []
     if student.StudentContactInfo.EnablePrimaryEmailNotifications:
-        send_email(
-            to_user=f'{student.StudentContactInfo.ParentOneFirstName} {student.StudentContactInfo.ParentOneLastName}',
-            to_email=[student.StudentContactInfo.PrimaryEmail],
-            subj="Student Account Information Has Been Updated!",
-            messages=[
-                "Your student's account information has been updated!",
-                "If you're not aware of updates to your student's account, please contact an administrator for more information."
-            ],
-        )
+        recipients.append((f'{student.StudentContactInfo.ParentOneFirstName} {student.StudentContactInfo.ParentOneLastName}', student.StudentContactInfo.PrimaryEmail))
     if student.StudentContactInfo.EnableSecondaryEmailNotifications:
-        send_email(
-            to_user=f'{student.StudentContactInfo.ParentTwoFirstName} {student.StudentContactInfo.ParentTwoLastName}',
-            to_email=[student.StudentContactInfo.SecondaryEmail],
+        recipients.append((f'{student.StudentContactInfo.ParentTwoFirstName} {student.StudentContactInfo.ParentTwoLastName}', student.StudentContactInfo.SecondaryEmail))
+    if recipients:
+        send_bulk_email(
+            recipients=recipients,
             subj="Student Account Information Has Been Updated!",
             messages=[
                 "Your student's account information has been updated!",
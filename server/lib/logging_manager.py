@@ -2,13 +2,26 @@ from __future__ import annotations
 import logging
 from typing import Union, List
 from enum import Enum, unique
-from os import path, makedirs
-from logging.handlers import RotatingFileHandler
+from os import makedirs
+from queue import SimpleQueue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from server.lib.config_manager import ConfigManager
 from server.lib.utils.print_utils import debug_print
-from server.lib.strings import ROOT_DIR, META_NAME, META_VERSION, LOG_ORIGIN_GENERAL, LOG_ORIGIN_STARTUP
+from server.lib.strings import META_NAME, META_VERSION, LOG_ORIGIN_GENERAL
 from server.lib.error_codes import ERR_LOGGING_MNGR_INCORRECT_PARAMS
 
+# The log message format with the project name and version header prefix, this is built once instead of on every logged event.
+_LOG_FORMAT = f"[{META_NAME}({META_VERSION}).%s]%s %s"
+# The logging settings from the server configuration file, these are read once when the module is loaded.
+LOG_DIRECTORY = ConfigManager().config()['Logging']['log_directory']
+LOG_MAX_SIZE = int(ConfigManager().config()['Logging']['max_log_size'])
+LOG_MAX_LOGS = int(ConfigManager().config()['Logging']['max_logs'])
+# The active logger, the log level to logger method mapping, and the logging enabled flag of the logging manager.
+# These are module-level references so that logging an event doesn't walk the logging manager instance attributes.
+_LOGGER = None
+_LOG_DISPATCH = {}
+_ENABLED = False
+
 
 class LoggingManager:
     """
@@ -21,8 +34,7 @@ class LoggingManager:
     """
 
     _instance = None
-    __logger = None
-    __enable_logging = False
+    __log_listener = None
 
     def __new__(cls, enable_logging: bool = False):
         if cls._instance is None:
@@ -32,11 +44,9 @@ class LoggingManager:
                                    "Please check your server config file or include the missing parameters as startup arguments.\n "
                                    "If you are a server administrator, please refer to the software manual!")
             cls._instance = super(LoggingManager, cls).__new__(cls)
-            cls.__logger = None
-            cls.__enable_logging = False
+            cls.__log_listener = None
 
-            if not path.exists(ConfigManager().config()['Logging']['log_directory']):
-                makedirs(ConfigManager().config()['Logging']['log_directory'])
+            makedirs(LOG_DIRECTORY, exist_ok=True)
             if enable_logging:
                 cls._instance.enable()
         return cls.instance()
@@ -57,28 +67,45 @@ class LoggingManager:
     def initialize_logging(cls):
         """
         Initializes the logger library with a rotating file handler and the parameters provided.
+        Log records are placed on a queue and written to the rotating log files by a background listener thread.
         Make sure the logging manager is initialized before initializing logging.
 
         :return: None
         :raises RuntimeError: If the logging manager has not been initialized.
         """
+        global _LOGGER, _LOG_DISPATCH  # pylint: disable=W0603
         if not cls._instance:
             raise RuntimeError('Logging Manager class has not been instantiated, please instantiate the class first!')
         if not cls._instance.is_enabled():
             return
 
-        cls._instance.__logger = logging.getLogger("PCARuntimeLogging")
-        cls._instance.__logger.setLevel(cls._instance.LogLevel.LOG_DEBUG.value[0])
-        cls._instance.__logger.handlers = []
+        logger = logging.getLogger("PCARuntimeLogging")
+        logger.setLevel(cls._instance.LogLevel.LOG_DEBUG.value[0])
+        logger.handlers = []
 
-        log_file_name = f"{ConfigManager().config()['Logging']['log_directory']}/runtime.log"
+        log_file_name = f"{LOG_DIRECTORY}/runtime.log"
         handler = RotatingFileHandler(
             log_file_name,
-            maxBytes=int(ConfigManager().config()['Logging']['max_log_size']),
-            backupCount=int(ConfigManager().config()['Logging']['max_logs'])
+            maxBytes=LOG_MAX_SIZE,
+            backupCount=LOG_MAX_LOGS
         )
         handler.setFormatter(logging.Formatter('[%(asctime)s]-[%(levelname)s]-%(message)s'))
-        cls._instance.__logger.addHandler(handler)
+        # Queue the log records and let the listener thread write them to disk, so callers never block on file writes.
+        log_queue = SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        if cls._instance.__log_listener:
+            cls._instance.__log_listener.stop()
+        cls._instance.__log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        cls._instance.__log_listener.start()
+        # Map each log level to the matching logger method so that logging an event only requires a single lookup.
+        _LOG_DISPATCH = {
+            cls._instance.LogLevel.LOG_DEBUG: logger.debug,
+            cls._instance.LogLevel.LOG_INFO: logger.info,
+            cls._instance.LogLevel.LOG_WARNING: logger.warning,
+            cls._instance.LogLevel.LOG_ERROR: logger.error,
+            cls._instance.LogLevel.LOG_CRITICAL: logger.critical
+        }
+        _LOGGER = logger
 
     @classmethod
     def log(cls, log_type: LoggingManager.LogLevel, message: Union[List[str], str], origin: str = None, error_type: str = None,
@@ -101,41 +128,31 @@ class LoggingManager:
         :type exc_message: str, optional
         :return: None
         """
-        if cls._instance is None:
-            return
-        # If an event is trying to be logged but the logger is disabled, raise an error.
-        if not cls._instance.is_enabled():
+        # If an event is trying to be logged but the logger is disabled or the logging manager is not initialized, ignore the event.
+        if not _ENABLED:
             return
+        logger = _LOGGER
         # If logging is enabled, and the log service is missing, raise an error.
-        if cls._instance.__logger is None:
+        if logger is None:
             raise RuntimeError('Error: Logging is enabled but the logger has not been initialized.')
-        if None in (log_type, message):
+        if log_type is None or message is None:
             raise RuntimeError('Error: One or more required parameters to log events was missing.')
-        # If the provided log message is not a list, convert it to a list for simpler processing later.
-        if not isinstance(message, list):
-            message = [message]
-        # Format the log messages for outputting.
-        log_message = "\n".join(message) if len(message) > 1 else message[0]
-
-        # Format the message and log the event as necessary.
-        log_output = f'[{META_NAME}({META_VERSION}).{origin if origin else LOG_ORIGIN_GENERAL}]' \
-                     f'{f"<{error_type}>:" if error_type else ""} {log_message}'
+        # Retrieve the logger method for the log level before doing any formatting work.
+        log_method = _LOG_DISPATCH.get(log_type)
+        if log_method is None:
+            raise RuntimeError('Error: The logger tried to log a message with an invalid log level!')
+        # Format the log messages for outputting, a list of messages is joined into a multi-line message.
+        log_message = message if isinstance(message, str) else "\n".join(message)
+
+        # Prepare the log format and arguments, the logger only formats the message if a handler emits the event.
+        log_format = _LOG_FORMAT
+        log_args = (origin if origin else LOG_ORIGIN_GENERAL, f"<{error_type}>:" if error_type else "", log_message)
         # If an exception stack trace is provided, include the stack trace in the log message.
         if exc_message:
-            log_output += f"\n{exc_message}\n"
-        # Log the formatted message based on the log level.
-        if log_type == cls._instance.LogLevel.LOG_INFO:
-            cls._instance.__logger.info(log_output)
-        elif log_type == cls._instance.LogLevel.LOG_DEBUG:
-            cls._instance.__logger.debug(log_output)
-        elif log_type == cls._instance.LogLevel.LOG_WARNING:
-            cls._instance.__logger.warning(log_output)
-        elif log_type == cls._instance.LogLevel.LOG_ERROR:
-            cls._instance.__logger.error(log_output)
-        elif log_type == cls._instance.LogLevel.LOG_CRITICAL:
-            cls._instance.__logger.critical(log_output)
-        else:
-            raise RuntimeError('Error: The logger tried to log a message with an invalid log level!')
+            log_format += '\n%s\n'
+            log_args += (exc_message,)
+        # Log the message based on the log level.
+        log_method(log_format, *log_args)
         # After logging the event, print the message to the console if printing is allowed.
         if not no_print:
             debug_print(log_message, origin=origin, error_type=error_type)
@@ -150,7 +167,7 @@ class LoggingManager:
         """
         if cls._instance is None:
             return None
-        return cls._instance.__logger
+        return _LOGGER
 
     @classmethod
     def is_enabled(cls) -> bool | None:
@@ -161,7 +178,7 @@ class LoggingManager:
         :rtype: bool | None
         """
         if cls._instance:
-            return cls._instance.__enable_logging
+            return _ENABLED
         return None
 
     @classmethod
@@ -171,8 +188,9 @@ class LoggingManager:
 
         :return: None
         """
+        global _ENABLED  # pylint: disable=W0603
         if cls._instance:
-            cls._instance.__enable_logging = True
+            _ENABLED = True
 
     @classmethod
     def disable(cls):
@@ -182,8 +200,21 @@ class LoggingManager:
 
         :return: None
         """
+        global _ENABLED  # pylint: disable=W0603
         if cls._instance:
-            cls._instance.__enable_logging = False
+            _ENABLED = False
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Stops the background log listener after writing any queued log records to the log files.
+        This should be called when the application is shutting down.
+
+        :return: None
+        """
+        if cls._instance and cls._instance.__log_listener:
+            cls._instance.__log_listener.stop()
+            cls._instance.__log_listener = None
 
     @unique
     class LogLevel(Enum):
@@ -198,34 +229,34 @@ class LoggingManager:
         LOG_CRITICAL = 50, 'critical'
 
         @classmethod
-        def has_value_id(cls, value: int) -> Union[(int, str), None]:
+        def has_value_id(cls, value: int) -> Union[LoggingManager.LogLevel, None]:
             """
             This utility method checks if the given enum integer value is present in the Log Level tuple values.
 
             :param value: The integer value to check in the Log Level enum.
             :type value: int
-            :return: A tuple containing the integer value of the enum and the string representation.
-            :rtype: (int, str) | None
+            :return: The Log Level enum member that corresponds to the integer value.
+            :rtype: LoggingManager.LogLevel | None
             """
-            for item in cls._value2member_map_:
-                if value == item[0]:
-                    return item
-            return None
+            return cls._by_id.get(value)
 
         @classmethod
-        def has_value_label(cls, value: str) -> Union[(int, str), None]:
+        def has_value_label(cls, value: str) -> Union[LoggingManager.LogLevel, None]:
             """
             This utility method checks if the given enum string value is present in the Log Level tuple values.
 
             :param value: The string value to check in the Log Level enum.
             :type value: str
-            :return: A tuple containing the integer value of the enum and the string representation.
-            :rtype: (int, str) | None
+            :return: The Log Level enum member that corresponds to the string value.
+            :rtype: LoggingManager.LogLevel | None
             """
-            for item in cls._value2member_map_:
-                if value == item[1]:
-                    return item
-            return None
+            return cls._by_label.get(value)
+
+
+# Build the log level lookup tables once, so that log levels can be retrieved by their integer value or label without scanning the enum members.
+# pylint: disable=W0212
+LoggingManager.LogLevel._by_id = {log_level.value[0]: log_level for log_level in LoggingManager.LogLevel}
+LoggingManager.LogLevel._by_label = {log_level.value[1]: log_level for log_level in LoggingManager.LogLevel}
 
 
 # Create and initialize the logging manager with the provided parameters.
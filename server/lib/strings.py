@@ -9,6 +9,8 @@ from pathlib import Path
 META_VERSION = '1.0.5'
 META_NAME = 'PCAProject'
 ROOT_DIR = Path(__file__).parent.parent
+# The directory that holds the compiled bytecode of the report and email templates.
+TEMPLATE_CACHE_DIR = f'{ROOT_DIR}/.jinja_cache'
 
 # Logging Manager Metadata Constants
 # These string constants are used in the logging API to specify the type of log origin event.
@@ -3,9 +3,39 @@ This module contains utility functions related to the validation
 and formatting of date strings to ensure that a date is compatible with server processes.
 """
 
-from datetime import datetime
+import re
+from datetime import date
 from typing import List, Union
 
+# The date format used by the server for all date-related functionality.
+DATE_FORMAT = '%Y-%m-%d'
+# The date validation regex for the YYYY-MM-DD format, this is compiled once when the module is loaded.
+# Only ASCII digits are matched, since \d also matches other Unicode digits that int() would accept.
+# The month and day may be written without zero-padding (ex: 2022-3-5), the same as the dates accepted by the date format.
+date_validator_pattern = re.compile(r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})')
+
+
+def is_valid_date(date_str: str) -> bool:
+    """
+    This utility method is used to verify that a single date string is a valid calendar date in the YYYY-MM-DD format.
+
+    :param date_str: The date string to be validated.
+    :type date_str: str
+    :return: True if the provided date is a valid date in the YYYY-MM-DD format.
+    :rtype: bool
+    """
+    if not isinstance(date_str, str):
+        return False
+    date_match = date_validator_pattern.fullmatch(date_str)
+    if date_match is None:
+        return False
+    # The regex only validates the layout of the date, so make sure that the month and the day in the month exist (ex: 2022-02-30).
+    try:
+        date(int(date_match[1]), int(date_match[2]), int(date_match[3]))
+    except ValueError:
+        return False
+    return True
+
 
 def check_date_formats(dates: Union[List[str], str]) -> bool:
     """
@@ -17,13 +47,8 @@ def check_date_formats(dates: Union[List[str], str]) -> bool:
     :return: True if all the provided dates are in the YYYY-MM-DD format.
     :rtype: bool
     """
-    if dates is None:
+    if not dates:
         return False
     if isinstance(dates, str):
         dates = [dates]
-    for date in dates:
-        try:
-            datetime.strptime(date, '%Y-%m-%d')
-            return True
-        except ValueError:
-            return False
+    return all(is_valid_date(date_str) for date_str in dates)
@@ -4,22 +4,163 @@ of emails using the SmarterMail API.
 """
 
 import re
-from typing import List
+from os import makedirs
+import time
+from datetime import datetime, timezone
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
+import orjson
 import requests
-from jinja2 import Environment, FileSystemLoader
+from requests.adapters import HTTPAdapter
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 
 from server.lib.logging_manager import LoggingManager
 from server.lib.config_manager import ConfigManager
-from server.lib.strings import ROOT_DIR, LOG_ORIGIN_API
+from server.lib.strings import ROOT_DIR, TEMPLATE_CACHE_DIR, LOG_ORIGIN_API
 from server.web_api.api_routes import THIRD_PARTY_ROUTES
 
-# Email validation regex
-email_validator_regex = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+# Email validation regex, the pattern is matched against the entire email address.
+email_validator_regex = r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}'
+# The email validation regex is compiled once when the module is loaded and reused for every recipient address.
+email_validator_pattern = re.compile(email_validator_regex)
+# The maximum length of an email address that can be used in the recipient field of an email. (RFC 5321)
+MAX_EMAIL_LENGTH = 254
+# The template bytecode cache directory is only accessible by the server user, since cached bytecode is executed when loaded.
+makedirs(TEMPLATE_CACHE_DIR, mode=0o700, exist_ok=True)
 env = Environment(loader=FileSystemLoader(
     [
         f'{ROOT_DIR}/lib/email_service'
     ]
-))
+), bytecode_cache=FileSystemBytecodeCache(directory=TEMPLATE_CACHE_DIR), auto_reload=False)
+# The generic email template is compiled once when the module is loaded and reused for every email.
+generic_email_template = env.get_template('generic_email_template.html')
+
+# The email settings from the server configuration file, these are read once when the module is loaded.
+email_config = ConfigManager().config()['Email Settings']
+email_settings = {
+    "api": f"{'https://' if email_config.getboolean('pca_email_use_https') else 'http://'}{email_config['pca_email_api'].strip()}",
+    "username": email_config['pca_email_username'].strip(),
+    "password": email_config['pca_email_password'].strip()
+}
+# The SmarterMail API endpoints are built once from the email settings.
+email_settings["login_url"] = f"{email_settings['api']}{THIRD_PARTY_ROUTES.Email.login}"
+email_settings["send_url"] = f"{email_settings['api']}{THIRD_PARTY_ROUTES.Email.send_email}"
+# A single HTTP session is shared by all the SmarterMail API requests,
+# so that the connections to the mail server are pooled and kept alive between emails.
+email_http_session = requests.Session()
+email_http_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+email_http_session.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=50))
+# The pool of worker threads used to send an email to multiple recipients in parallel.
+email_pool = ThreadPoolExecutor(max_workers=8)
+# The SmarterMail API access token is cached and reused until it is close to expiring, and it is renewed 30 seconds before it expires.
+# The token expiration is read from the authentication response, and the token lifetime is assumed to be 15 minutes if the expiration is missing.
+EMAIL_TOKEN_LIFETIME = 15 * 60
+EMAIL_TOKEN_RENEWAL_MARGIN = 30
+email_token_cache = {"token": None, "expires_at": 0.0}
+# The lock that ensures only one thread authenticates with the SmarterMail API when the cached access token expires.
+email_token_lock = Lock()
+
+
+def get_email_access_token() -> str:
+    """
+    This utility method retrieves the cached SmarterMail API access token of the server's email account,
+    or authenticates with the SmarterMail API to retrieve a new access token if the cached token is missing or expired.
+
+    :return: The SmarterMail API access token.
+    :rtype: str
+    """
+    if email_token_cache["token"] and time.monotonic() < email_token_cache["expires_at"] - EMAIL_TOKEN_RENEWAL_MARGIN:
+        return email_token_cache["token"]
+    with email_token_lock:
+        # Check the cached access token again, in case another thread renewed it while waiting for the lock.
+        if email_token_cache["token"] and time.monotonic() < email_token_cache["expires_at"] - EMAIL_TOKEN_RENEWAL_MARGIN:
+            return email_token_cache["token"]
+        # Authenticate self first...
+        auth_request = email_http_session.post(email_settings['login_url'], data={
+            "username": email_settings['username'],
+            "password": email_settings['password']
+        })
+        resp_json = orjson.loads(auth_request.content) if auth_request.ok else {}
+        if not resp_json.get('accessToken'):
+            raise RuntimeError("Unable to authenticate with the SmarterMail API! Please make sure that the email settings in the server configuration file are valid.")
+        email_token_cache["token"] = resp_json['accessToken']
+        email_token_cache["expires_at"] = time.monotonic() + get_email_token_lifetime(resp_json.get('accessTokenExpiration'))
+        return email_token_cache["token"]
+
+
+def get_email_token_lifetime(token_expiration: str = None) -> float:
+    """
+    This utility method calculates the number of seconds until a SmarterMail API access token expires,
+    from the access token expiration time in the SmarterMail API authentication response.
+
+    :param token_expiration: The ISO 8601 expiration time of the access token. (Example: 2022-03-01T17:30:00Z)
+    :type token_expiration: str, optional
+    :return: The number of seconds until the access token expires, or the default token lifetime if the expiration time is missing or invalid.
+    :rtype: float
+    """
+    if not token_expiration:
+        return EMAIL_TOKEN_LIFETIME
+    try:
+        expiration = datetime.fromisoformat(token_expiration.replace('Z', '+00:00'))
+    except ValueError:
+        return EMAIL_TOKEN_LIFETIME
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=timezone.utc)
+    return (expiration - datetime.now(timezone.utc)).total_seconds()
+
+
+def clear_email_access_token(token: str):
+    """
+    This utility method removes the provided SmarterMail API access token from the cache if it is still the cached access token,
+    so that the next email authenticates with the SmarterMail API again. This is used when the SmarterMail API rejects the access token.
+
+    :param token: The SmarterMail API access token that was rejected.
+    :type token: str, required
+    :return: None
+    """
+    with email_token_lock:
+        if email_token_cache["token"] == token:
+            email_token_cache["token"] = None
+            email_token_cache["expires_at"] = 0.0
+
+
+def post_email(email_data: Dict[str, any]) -> bool:
+    """
+    This utility method sends a single email with the SmarterMail API message-put endpoint using the cached access token.
+    If the SmarterMail API rejects the access token, the cached access token is cleared and the email is sent once more with a new access token.
+
+    :param email_data: The email options of the email, including the receiving email address.
+    :type email_data: Dict[str, any], required
+    :return: True if the SmarterMail API accepted the email, False if the request failed or the email was rejected.
+    :rtype: bool
+    """
+    try:
+        token = get_email_access_token()
+        email_request = email_http_session.post(email_settings['send_url'], data=email_data, headers={'Authorization': f'Bearer {token}'})
+        if email_request.status_code == 401:
+            clear_email_access_token(token)
+            email_request = email_http_session.post(email_settings['send_url'], data=email_data,
+                                                    headers={'Authorization': f'Bearer {get_email_access_token()}'})
+        return email_request.ok
+    except (requests.RequestException, RuntimeError, orjson.JSONDecodeError):
+        # The request failed, or the server could not authenticate with the SmarterMail API, so the email is treated as not sent.
+        return False
+
+
+@lru_cache(maxsize=None)
+def get_email_template(template_name: str) -> Template:
+    """
+    This utility method retrieves and caches a compiled email template by the file name,
+    so that each email template is only loaded and compiled once.
+
+    :param template_name: The file name of the email template. (Example: leave_request_email_template.html)
+    :type template_name: str, required
+    :return: The compiled email template.
+    :rtype: jinja2.Template
+    """
+    return env.get_template(template_name)
 
 
 def send_test_email():
@@ -30,25 +171,62 @@ def send_test_email():
     :return: A JSON-Compatible dictionary of the SmarterMail API response to sending a test email.
     :rtype: Dict[str, any]
     """
-    email_api = f"{'https://' if ConfigManager().config().getboolean('Email Settings', 'pca_email_use_https') else 'http://'}{ConfigManager().config()['Email Settings']['pca_email_api']}"
-    # Authenticate self first...
-    auth_request = requests.post(f"{email_api}{THIRD_PARTY_ROUTES.Email.login}", data={
-        "username": ConfigManager().config()['Email Settings']['pca_email_username'].strip(),
-        "password": ConfigManager().config()['Email Settings']['pca_email_password'].strip()
-    })
-    resp_json = auth_request.json()
-    access_token = resp_json['accessToken']
-
     # Configure authentication header...
-    headers = {'Authorization': f'Bearer {access_token}'}
+    headers = {'Authorization': f'Bearer {get_email_access_token()}'}
     # Send the email and check the response...
-    email_request = requests.post(f"{email_api}{THIRD_PARTY_ROUTES.Email.send_email}", data={
-        "from": ConfigManager().config()['Email Settings']['pca_email_username'].strip(),
-        "to": ConfigManager().config()['Email Settings']['pca_email_username'].strip(),
+    email_request = email_http_session.post(email_settings['send_url'], data={
+        "from": email_settings['username'],
+        "to": email_settings['username'],
         "subject": "self test email - please ignore!",
         "messagePlainText": "self test email - please ignore!"
     }, headers=headers)
-    return email_request.json()
+    return orjson.loads(email_request.content)
+
+
+def is_valid_email(email: str) -> bool:
+    """
+    This utility method checks if the provided email address is valid.
+    Email addresses that are longer than the 254 character limit of an address, or that are missing the local part or the domain,
+    are rejected with plain string checks before the email validation regex is used. Limiting the length also bounds the backtracking work of the regex.
+
+    :param email: The email address to validate.
+    :type email: str, required
+    :return: True if the email address is valid.
+    :rtype: bool
+    """
+    if len(email) > MAX_EMAIL_LENGTH:
+        return False
+    # An email address needs a local part before the last '@', and a '.' in the domain after it.
+    at_index = email.rfind('@')
+    if at_index < 1 or '.' not in email[at_index + 1:]:
+        return False
+    return email_validator_pattern.fullmatch(email) is not None
+
+
+def render_email(to_user: str, messages: List[str], template: str = None) -> str:
+    """
+    This utility method renders the HTML body of an email for the provided receiving user's name and messages.
+
+    :param to_user: The receiving user's name.
+    :type to_user: str, required
+    :param messages: A list of all the individual messages that should be formatted and rendered in the email.
+    :type messages: List[str], required
+    :param template: Optionally the email template can be specified by the file name, otherwise the generic email template is used.
+    :type template: str, optional
+    :return: The rendered HTML body of the email.
+    :rtype: str
+    """
+    if template is None:
+        return generic_email_template.render({
+            "title": "Automated Email",
+            "username": to_user.lower().strip().title(),
+            "messages": messages
+        })
+    return get_email_template(template).render({
+        "title": "Automated Email",
+        "message_title": to_user.lower().strip().title(),
+        "messages": messages
+    })
 
 
 def send_email(to_user: str, to_email: List[str], subj: str, messages: List[str], template: str = None, to_cc: str = None) -> bool:
@@ -73,21 +251,20 @@ def send_email(to_user: str, to_email: List[str], subj: str, messages: List[str]
     :rtype: bool
     :raises RuntimeError: If any of the provided parameters are invalid, or the email configuration settings in the server configuration file is invalid.
     """
-    email_api = f"{'https://' if ConfigManager().config().getboolean('Email Settings', 'pca_email_use_https') else 'http://'}{ConfigManager().config()['Email Settings']['pca_email_api']}"
     # Validate provided information and email address.
-    if None in (to_user, to_email, subj, messages):
+    if to_user is None or to_email is None or subj is None or messages is None:
         raise RuntimeError("Cannot send an email with the 'to', 'subject', or 'message' fields being blank!")
     if to_cc and isinstance(to_cc, str):
         to_cc = [to_cc]
     if to_email and isinstance(to_email, str):
         to_email = [to_email]
-    if to_email and len(to_email) == 0:
+    if len(to_email) == 0:
         raise RuntimeError("Cannot send email to empty address(es)! Please make sure that the email address(es) is valid!")
     to = [email.lower().strip() for email in to_email]
     subj = subj.strip()
     messages = [message.strip() for message in messages]
     for email in to:
-        if not re.fullmatch(email_validator_regex, email):
+        if not is_valid_email(email):
             raise RuntimeError("Cannot send email to invalid email address(es)! Please make sure that the email address(es) uses only valid characters.")
     if len(subj) == 0:
         raise RuntimeError("Cannot send an email with a blank subject!")
@@ -95,50 +272,76 @@ def send_email(to_user: str, to_email: List[str], subj: str, messages: List[str]
         raise RuntimeError("Cannot send an email with a blank message!")
 
     # Prepare the HTML email if enabled...
-    if template is None:
-        template = env.get_template(f'generic_email_template.html')
-        template_vars = {
-            "title": f"Automated Email",
-            "username": to_user.lower().strip().title(),
-            "messages": messages
-        }
-    else:
-        template = env.get_template(template)
-        template_vars = {
-            "title": f"Automated Email",
-            "message_title": to_user.lower().strip().title(),
-            "messages": messages
-        }
-    html_out = template.render(template_vars)
+    html_out = render_email(to_user, messages, template)
 
-    # Authenticate self first...
-    auth_request = requests.post(f"{email_api}{THIRD_PARTY_ROUTES.Email.login}", data={
-        "username": ConfigManager().config()['Email Settings']['pca_email_username'].strip(),
-        "password": ConfigManager().config()['Email Settings']['pca_email_password'].strip()
-    })
-    resp_json = auth_request.json()
-    access_token = resp_json['accessToken']
+    # Configure email options...
+    email_opts = {
+        "from": email_settings['username'],
+        "subject": subj,
+        "messageHTML": html_out,
+        "messagePlainText": "\n".join(messages)
+    }
+    if to_cc:
+        email_opts["cc"] = [", ".join(to_cc)]
+    # Send the email to each recipient in parallel, and check that every email was accepted...
+    email_requests = [email_pool.submit(post_email, {**email_opts, "to": email}) for email in to]
+    if not all([email_request.result() for email_request in email_requests]):
+        return False
+    LoggingManager().log(LoggingManager.LogLevel.LOG_INFO,
+                         f"An email was sent to the following email addresses: {', '.join(to)}.",
+                         origin=LOG_ORIGIN_API, no_print=False)
+    return True
+
+
+def send_bulk_email(recipients: List[Tuple[str, str]], subj: str, messages: List[str], template: str = None) -> bool:
+    """
+    This utility method sends the same email to multiple receiving users with a single authentication to the SmarterMail API.
+    The email body is rendered once for each distinct receiving user's name, and all the emails are sent in parallel.
+    Use this method instead of calling :func:`send_email` repeatedly when the same notification is sent to multiple users.
+
+    :param recipients: A list of the receiving users, where each receiving user is a tuple of the user's name and email address.
+    :type recipients: List[Tuple[str, str]], required
+    :param subj: The subject text of the email.
+    :type subj: str, required
+    :param messages: A list of all the individual messages that should be formatted and rendered in the sent emails.
+    :type messages: List[str], required
+    :param template: Optionally the email template can be specified by the file name. For example, leave requests use a different email template than generic emails.
+    :type template: str, optional
+    :return: True if the emails were successfully formatted, rendered, and sent to all the receiving users.
+    :rtype: bool
+    :raises RuntimeError: If any of the provided parameters are invalid, or the email configuration settings in the server configuration file is invalid.
+    """
+    # Validate provided information and email addresses.
+    if recipients is None or subj is None or messages is None:
+        raise RuntimeError("Cannot send an email with the 'to', 'subject', or 'message' fields being blank!")
+    if len(recipients) == 0:
+        raise RuntimeError("Cannot send email to empty address(es)! Please make sure that the email address(es) is valid!")
+    recipients = [(to_user, to_email.lower().strip()) for to_user, to_email in recipients]
+    subj = subj.strip()
+    messages = [message.strip() for message in messages]
+    for _, email in recipients:
+        if not is_valid_email(email):
+            raise RuntimeError("Cannot send email to invalid email address(es)! Please make sure that the email address(es) uses only valid characters.")
+    if len(subj) == 0:
+        raise RuntimeError("Cannot send an email with a blank subject!")
+    if len(messages) == 0:
+        raise RuntimeError("Cannot send an email with a blank message!")
+
+    # Prepare the HTML emails, rendering the email body only once for each receiving user's name...
+    rendered_emails = {to_user: render_email(to_user, messages, template) for to_user in {to_user for to_user, _ in recipients}}
 
-    # Configure authentication header...
-    headers = {'Authorization': f'Bearer {access_token}'}
     # Configure email options...
-    for email in to:
-        email_opts = {
-            "from": ConfigManager().config()['Email Settings']['pca_email_username'].strip(),
-            "to": email,
-            "subject": subj,
-            "messageHTML": html_out,
-            "messagePlainText": "\n".join(messages)
-        }
-        if to_cc:
-            email_opts["cc"] = [", ".join(to_cc)]
-        # Send the email...
-        try:
-            requests.post(f"{email_api}{THIRD_PARTY_ROUTES.Email.send_email}",
-                          data=email_opts, headers=headers)
-        except requests.exceptions.HTTPError:
-            return False
+    email_opts = {
+        "from": email_settings['username'],
+        "subject": subj,
+        "messagePlainText": "\n".join(messages)
+    }
+    # Send the email to each recipient in parallel, and check that every email was accepted...
+    email_requests = [email_pool.submit(post_email, {**email_opts, "to": email, "messageHTML": rendered_emails[to_user]})
+                      for to_user, email in recipients]
+    if not all([email_request.result() for email_request in email_requests]):
+        return False
     LoggingManager().log(LoggingManager.LogLevel.LOG_INFO,
-                         f"An email was sent to the following email addresses: {', '.join([email for email in to])}.",
+                         f"An email was sent to the following email addresses: {', '.join([email for _, email in recipients])}.",
                          origin=LOG_ORIGIN_API, no_print=False)
     return True
@@ -5,18 +5,26 @@ a new employee record is being added to the database.
 """
 
 from __future__ import annotations
-from sqlalchemy import func
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from server.lib.data_models.employee_contact_info import EmployeeContactInfo
 from server.lib.logging_manager import LoggingManager
 from server.lib.error_codes import ERR_DB_SERVICE_INACTIVE
 from sqlalchemy.exc import SQLAlchemyError
 from server.lib.data_models.employee import Employee
-from server.lib.data_models.employee_role import EmployeeRole
 from passlib.hash import bcrypt
 from server.lib.strings import LOG_ERROR_GENERAL, LOG_ORIGIN_API
 from server.lib.database_manager import main_engine as db_engine, get_db_session
 
+# The BCrypt password hasher, configured once with the cost factor used for all employee password hashes.
+password_hasher = bcrypt.using(rounds=12)
+# The query for the highest employee record ID, this is built once so that the compiled SQL statement is reused from the statement cache.
+max_employee_id_query = select(func.max(Employee.id))
+# The pool of worker threads used to hash and verify passwords, so that the slow BCrypt digests do not block the event loop.
+password_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 
 async def generate_employee_id(first_name: str, last_name: str, session: Session = None) -> str | None:
     """
@@ -43,21 +51,10 @@ async def generate_employee_id(first_name: str, last_name: str, session: Session
         return None
     try:
         # Query the last record with the highest ID that was inserted into the database to calculate the employee's new unique record ID.
-        highest_id = session.query(func.max(Employee.id)).scalar()
+        highest_id = session.execute(max_employee_id_query).scalar()
+        # If there are no employee records yet, the first employee ID uses a unique record ID of 1.
         if highest_id is None:
-            blank_role = EmployeeRole('BlankRole')
-            session.add(blank_role)
-            session.flush()
-            blank_contact_info = EmployeeContactInfo("BlankID", "BlankName", "blank@name.com", False, False)
-            # session.add(blank_contact_info)
-            # session.flush()
-            blank_employee = Employee("BlankID", "BlankEmployee", "BlankEmployee", "BlankPasswordHash", blank_role.id, blank_contact_info, enabled=False)
-            session.add(blank_employee)
-            session.flush()
-            session.delete(blank_employee)
-            session.delete(blank_role)
-            session.delete(blank_contact_info)
-            highest_id = blank_employee.id
+            highest_id = 0
         # Generate the ID using the first name, last name, and unique record ID.
         new_employee_id = f"{first_name[0].lower()}{last_name.lower()}{highest_id+1}"
         LoggingManager().log(LoggingManager.LogLevel.LOG_INFO,
@@ -80,7 +77,7 @@ def create_employee_password_hashes_sync(password: str) -> str | None:
     """
     if password is None or len(password) == 0:
         return None
-    employee_password_hash = bcrypt.hash(password.encode('utf-8'))
+    employee_password_hash = password_hasher.hash(password.encode('utf-8'))
     return employee_password_hash
 
 
@@ -95,7 +92,8 @@ async def create_employee_password_hashes(password: str) -> str | None:
     """
     if password is None or len(password) == 0:
         return None
-    employee_password_hash = bcrypt.hash(password.encode('utf-8'))
+    # Hash the password in the password thread pool to avoid blocking the event loop.
+    employee_password_hash = await asyncio.get_running_loop().run_in_executor(password_pool, password_hasher.hash, password.encode('utf-8'))
     return employee_password_hash
 
 
@@ -113,7 +111,8 @@ async def verify_employee_password(plain_password: str, password_hash: str) -> b
     :return: True if the password is correct, False if it is incorrect, or None if the provided parameters are invalid.
     :rtype: bool | None
     """
-    if None in (plain_password, password_hash) or len(plain_password) == 0 or len(password_hash) == 0:
+    if plain_password is None or password_hash is None or len(plain_password) == 0 or len(password_hash) == 0:
         return None
-    verify_key = bcrypt.verify(plain_password.encode('utf-8'), password_hash)
+    # Verify the password in the password thread pool to avoid blocking the event loop.
+    verify_key = await asyncio.get_running_loop().run_in_executor(password_pool, password_hasher.verify, plain_password.encode('utf-8'), password_hash)
     return verify_key
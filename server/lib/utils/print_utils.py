@@ -6,6 +6,15 @@ For example, the ``console_print`` utility method can be used to display a messa
 from server.lib.strings import META_NAME, META_VERSION, LOG_ORIGIN_GENERAL
 from server.lib.config_manager import ConfigManager
 
+# The console output prefix with the project name and version, this is built once instead of on every printed message.
+_PRINT_PREFIX = f'[{META_NAME}({META_VERSION}).'
+# The console output modes from the server configuration file, these are read once when the module is loaded.
+# Debug output is only displayed in debug mode, and console output is only displayed outside of debug mode. Quiet mode disables both.
+_SYS_DEBUG = ConfigManager().config().getboolean('Debug Mode', 'sys_debug')
+_QUIET_MODE = ConfigManager().config().getboolean('Debug Mode', 'quiet_mode')
+DEBUG_OUTPUT_ENABLED = _SYS_DEBUG and not _QUIET_MODE
+CONSOLE_OUTPUT_ENABLED = not _SYS_DEBUG and not _QUIET_MODE
+
 
 def debug_print(message: str, origin: str = None, error_type: str = None):
     """
@@ -22,9 +31,9 @@ def debug_print(message: str, origin: str = None, error_type: str = None):
     :type error_type: str, optional
     :return: None
     """
-    if ConfigManager().config().getboolean('Debug Mode', 'sys_debug') and not ConfigManager().config().getboolean('Debug Mode', 'quiet_mode'):
-        print(f'[{META_NAME}({META_VERSION}).{origin if origin else LOG_ORIGIN_GENERAL}]'
-              f'{f"<{error_type}>:" if error_type else ""} {message}')
+    if not DEBUG_OUTPUT_ENABLED:
+        return
+    print(f'{_PRINT_PREFIX}{origin if origin else LOG_ORIGIN_GENERAL}]{f"<{error_type}>:" if error_type else ""} {message}')
 
 
 def console_print(message: str, origin: str = None, error_type: str = None):
@@ -42,6 +51,6 @@ def console_print(message: str, origin: str = None, error_type: str = None):
     :type error_type: str, optional
     :return: None
     """
-    if not ConfigManager().config().getboolean('Debug Mode', 'sys_debug') and not ConfigManager().config().getboolean('Debug Mode', 'quiet_mode'):
-        print(f'[{META_NAME}({META_VERSION}).{origin if origin else LOG_ORIGIN_GENERAL}]'
-              f'{f"<{error_type}>:" if error_type else ""} {message}')
+    if not CONSOLE_OUTPUT_ENABLED:
+        return
+    print(f'{_PRINT_PREFIX}{origin if origin else LOG_ORIGIN_GENERAL}]{f"<{error_type}>:" if error_type else ""} {message}')
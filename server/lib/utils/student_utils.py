@@ -5,6 +5,7 @@ a new student record is being added to the database.
 """
 
 from __future__ import annotations
+from sqlalchemy import select, bindparam
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from server.lib.data_models.student import Student
@@ -12,6 +13,9 @@ from server.lib.logging_manager import LoggingManager
 from server.lib.database_manager import get_db_session
 from server.lib.strings import LOG_ERROR_DATABASE, LOG_ERROR_GENERAL, LOG_ORIGIN_GENERAL
 
+# The query for the student IDs that start with a given prefix, this is built once so that the compiled SQL statement is reused from the statement cache.
+student_ids_with_prefix_query = select(Student.StudentID).where(Student.StudentID.like(bindparam('student_id_pattern')))
+
 
 async def generate_student_id(first_name: str, last_name: str, car_pool_number: int, session: Session = None) -> str:
     """
@@ -36,14 +40,19 @@ async def generate_student_id(first_name: str, last_name: str, car_pool_number:
         LoggingManager().log(LoggingManager.LogLevel.LOG_CRITICAL, f"One or more provided parameters to generate the student ID was invalid!",
                              error_type=LOG_ORIGIN_GENERAL, origin=LOG_ORIGIN_GENERAL, no_print=False)
         raise RuntimeError(f'One or more provided parameters to generate the student ID was invalid!')
-    new_student_id = f"{first_name[0].lower()}{last_name.lower()}{car_pool_number}"
+    student_id_prefix = f"{first_name[0].lower()}{last_name.lower()}{car_pool_number}"
+    new_student_id = student_id_prefix
     student_id_duplicate_counter = 1
     try:
-        student_id_exists = session.query(Student).filter(Student.StudentID == new_student_id).first()
-        while student_id_exists:
-            new_student_id = f"{first_name[0].lower()}{last_name.lower()}{car_pool_number}{student_id_duplicate_counter}"
+        # Retrieve all the existing student IDs that start with the new student ID in a single query,
+        # and find the first unused student ID without querying the database for each duplicate.
+        # The existing IDs are lower-cased, since the database compares student IDs case-insensitively.
+        existing_student_ids = {student_id.lower() for student_id in session.execute(
+            student_ids_with_prefix_query, {"student_id_pattern": f"{student_id_prefix}%"}
+        ).scalars()}
+        while new_student_id in existing_student_ids:
+            new_student_id = f"{student_id_prefix}{student_id_duplicate_counter}"
             student_id_duplicate_counter += 1
-            student_id_exists = session.query(Student).filter(Student.StudentID == new_student_id).first()
     except SQLAlchemyError as err:
         LoggingManager().log(LoggingManager.LogLevel.LOG_CRITICAL, f"Encountered an error creating a unique student ID: {str(err)}",
                              error_type=LOG_ERROR_DATABASE, origin=LOG_ERROR_DATABASE, no_print=False)
@@ -3,7 +3,7 @@ The timesheet utility module contains utility methods that serve to help tasks
 related to formatting and validating timesheet information.
 """
 
-from math import modf
+from math import ceil
 
 
 def round_hours_to_custom_increment(timesheet_hours: float, increment: float = 0.5) -> float:
@@ -20,11 +20,6 @@ def round_hours_to_custom_increment(timesheet_hours: float, increment: float = 0
     """
     if timesheet_hours <= 0:
         return 0
-    minutes, hours = modf(timesheet_hours)
-    if minutes <= increment:
-        if minutes != 0:
-            minutes = increment
-    else:
-        hours += 1
-        minutes = 0
-    return hours + minutes
+    # Round the number of increments before taking the ceiling so that floating-point noise
+    # (ex: 1.1 / 0.1 = 11.000000000000002) doesn't round the hours up by an extra increment.
+    return ceil(round(timesheet_hours / increment, 9)) * increment
@@ -4,6 +4,9 @@ from server.web_api.web_service import WebService
 from server.lib.error_codes import ERR_WEB_SESSION_MNGR_INCORRECT_PARAMS
 from server.lib.config_manager import ConfigManager
 
+# The logging manager instance used by the web session manager, this is bound once when the module is loaded.
+_LOG = LoggingManager()
+
 
 class WebSessionManager:
     """
@@ -34,12 +37,15 @@ class WebSessionManager:
 
         :return: None
         """
+        # Retrieve the server configuration and the API server settings once for all the web service parameters.
+        cfg = ConfigManager().config()
+        api = cfg['API Server']
         self.web_service: WebService = WebService(self.web_ip, self.web_port,
-                                                  use_https=ConfigManager().config().getboolean('API Server', 'use_https'),
-                                                  ssl_cert=ConfigManager().config()['API Server']['cert_path'],
-                                                  ssl_key=ConfigManager().config()['API Server']['key_path'],
-                                                  debug_mode=ConfigManager().config().getboolean('Debug Mode', 'api_debug'))
-        LoggingManager().log(LoggingManager.LogLevel.LOG_INFO, "Web session manager initialized.", origin=LOG_ORIGIN_STARTUP, no_print=False)
+                                                  use_https=api.getboolean('use_https'),
+                                                  ssl_cert=api['cert_path'],
+                                                  ssl_key=api['key_path'],
+                                                  debug_mode=cfg.getboolean('Debug Mode', 'api_debug'))
+        _LOG.log(LoggingManager.LogLevel.LOG_INFO, "Web session manager initialized.", origin=LOG_ORIGIN_STARTUP, no_print=False)
 
     def start_web_server(self):
         """
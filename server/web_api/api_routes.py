@@ -29,6 +29,7 @@ class ThirdPartyRoutes:
 
 class APIRoutes:
     index = '/'
+    favicon = '/favicon.ico'
     core = '/api/v1'
     status = '/api/v1/status'
     routes = '/api/v1/routes'
@@ -1,4 +1,7 @@
 from typing import Dict, Optional, Any
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
 
 
 class ResponseModel:
@@ -22,9 +25,8 @@ class ResponseModel:
         """
         self.status: int = status
         self.message: str = message
-        self.data: Dict[str, any] = {}
-        if data_dict:
-            self.add_data_dict(data_dict)
+        # Copy the provided data dictionary directly instead of updating an empty dictionary through a method call.
+        self.data: Dict[str, any] = dict(data_dict) if data_dict else {}
 
     def add_data_dict(self, data: Dict[str, any]):
         """
@@ -61,3 +63,17 @@ class ResponseModel:
         :rtype: Dict[str, any]
         """
         return self.__dict__
+
+    def as_response(self, status_code: int = None) -> Response:
+        """
+        Serializes the response model into a JSON HTTP response with orjson.
+        Endpoints should return this response instead of the response model, so that the response model is serialized directly
+        instead of being converted field by field with the FastAPI json encoder. Values that orjson can't serialize natively still fall back to the FastAPI json encoder.
+
+        :param status_code: The HTTP status code of the response, the status code of the response model is used if it is not provided.
+        :type status_code: int, optional
+        :return: The JSON HTTP response containing the response model.
+        :rtype: fastapi.responses.Response
+        """
+        return Response(orjson.dumps(self.__dict__, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS),
+                        status_code=self.status if status_code is None else status_code, media_type="application/json")
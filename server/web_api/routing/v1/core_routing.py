@@ -12,22 +12,25 @@ router = InferringRouter()
 # pylint: disable=R0201
 @cbv(router)
 class CoreRouter:
-    @router.get(API_ROUTES.core, status_code=status.HTTP_200_OK)
-    def main_api(self):
-        """
-        An endpoint that checks the status of the v1 segment of the API service.
+    class Read:
+        @staticmethod
+        @router.get(API_ROUTES.core, status_code=status.HTTP_200_OK)
+        async def main_api():
+            """
+            An endpoint that checks the status of the v1 segment of the API service.
 
-        :return: A response model containing the online status of the v1 segment of the API service.
-        :rtype: server.web_api.models.ResponseModel
-        """
-        return ResponseModel(status.HTTP_200_OK, "success")
+            :return: A response model containing the online status of the v1 segment of the API service.
+            :rtype: fastapi.responses.Response
+            """
+            return ResponseModel(status.HTTP_200_OK, "success").as_response()
 
-    @router.get(API_ROUTES.status, status_code=status.HTTP_200_OK)
-    def status(self):
-        """
-        An endpoint that checks the status of the database connection in the server.
+        @staticmethod
+        @router.get(API_ROUTES.status, status_code=status.HTTP_200_OK)
+        async def status():
+            """
+            An endpoint that checks the status of the database connection in the server.
 
-        :return: A response model containing the online status of the database connection.
-        :rtype: server.web_api.models.ResponseModel
-        """
-        return ResponseModel(status.HTTP_200_OK, "success", {"status": "online" if is_active() else "offline"})
+            :return: A response model containing the online status of the database connection.
+            :rtype: fastapi.responses.Response
+            """
+            return ResponseModel(status.HTTP_200_OK, "success", {"status": "online" if is_active() else "offline"}).as_response()
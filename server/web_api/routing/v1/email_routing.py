@@ -23,9 +23,9 @@ class EmailRouter:
             :param token: The JSON Web Token responsible for authenticating the user to this endpoint.
             :type token: str, required
             :return: A response model containing the JSON response of the test email that was sent.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             json_resp = send_test_email()
-            return ResponseModel(status.HTTP_200_OK, "success", json_resp)
+            return ResponseModel(status.HTTP_200_OK, "success", json_resp).as_response()
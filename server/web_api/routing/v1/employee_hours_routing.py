@@ -33,7 +33,7 @@ class EmployeeHoursRouter:
             :param session: The database session to use to retrieve all the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the submitted timesheet consisting of the hours and the day worked.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided timesheet information is invalid, or the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -47,7 +47,7 @@ class EmployeeHoursRouter:
             if created_time_sheets is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                     detail="The provided timesheet information is invalid or the employee is not registered in the database!")
-            return ResponseModel(status.HTTP_201_CREATED, "success", {"time_sheets": [timesheet.as_dict() for timesheet in created_time_sheets]})
+            return ResponseModel(status.HTTP_201_CREATED, "success", {"time_sheets": [timesheet.as_dict() for timesheet in created_time_sheets]}).as_response()
 
     class Read:
         @staticmethod
@@ -70,7 +70,7 @@ class EmployeeHoursRouter:
             :param session: The database session to use to retrieve all the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the total number of work hours, PTO hours, and extra/overtime hours from the days within the provided date range.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided employee has no hours logged into the system, or the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -83,7 +83,7 @@ class EmployeeHoursRouter:
             if date_end is None:
                 date_end = date_start
             total_hours_and_list = await get_employee_hours_total(employee_id.strip(), date_start, date_end, session, hours_only=True)
-            return ResponseModel(status.HTTP_200_OK, "success", total_hours_and_list)
+            return ResponseModel(status.HTTP_200_OK, "success", total_hours_and_list).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.Timesheet.one_timesheet, status_code=status.HTTP_200_OK)
@@ -105,7 +105,7 @@ class EmployeeHoursRouter:
             :param session: The database session to use to retrieve all the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the total number of work hours, PTO hours, and extra/overtime hours from the days within the provided date range.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided employee has no hours logged into the system, or the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -118,7 +118,7 @@ class EmployeeHoursRouter:
             if date_end is None:
                 date_end = date_start
             total_hours_and_list = await get_employee_hours_total(employee_id.strip(), date_start, date_end, session)
-            return ResponseModel(status.HTTP_200_OK, "success", total_hours_and_list)
+            return ResponseModel(status.HTTP_200_OK, "success", total_hours_and_list).as_response()
 
     class Update:
         @staticmethod
@@ -137,7 +137,7 @@ class EmployeeHoursRouter:
             :param session: The database session to use to update the timesheet data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the updated total number of work hours, PTO hours, and extra/overtime hours for the employee on the given date.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided employee has no hours logged into the system, or the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -150,7 +150,7 @@ class EmployeeHoursRouter:
             updated_time_sheet = await update_employee_hours(employee_id, updated_employee_hours.date_worked,
                                                              updated_employee_hours.work_hours, updated_employee_hours.pto_hours,
                                                              updated_employee_hours.extra_hours, updated_employee_hours.comment, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"time_sheet": updated_time_sheet.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"time_sheet": updated_time_sheet.as_dict()}).as_response()
 
     class Delete:
         @staticmethod
@@ -166,7 +166,7 @@ class EmployeeHoursRouter:
             :param session: The database session to use to update the timesheet data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model displaying the success or failure of the deletion task.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided employee has no hours logged into the system, or the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -177,7 +177,7 @@ class EmployeeHoursRouter:
             if employee is None or (employee.EmployeeID != employee_id.strip() and not await is_admin(employee)):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="The user does not have sufficient permissions.")
             await delete_all_employee_time_sheets(employee_id, session)
-            return ResponseModel(status.HTTP_200_OK, "success")
+            return ResponseModel(status.HTTP_200_OK, "success").as_response()
 
         @staticmethod
         @router.delete(API_ROUTES.Timesheet.one_timesheet, status_code=status.HTTP_200_OK)
@@ -196,7 +196,7 @@ class EmployeeHoursRouter:
             :param session: The database session to use to update the timesheet data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the deleted time sheets from the provided date(s).
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided employee has no hours logged into the system, or the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -207,4 +207,4 @@ class EmployeeHoursRouter:
             if employee is None or (employee.EmployeeID != employee_id.strip() and not await is_admin(employee)):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="The user does not have sufficient permissions.")
             deleted_time_sheets = await delete_employee_time_sheets(employee_id, delete_employee_hours, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"time_sheets": [time_sheet.as_dict() for time_sheet in deleted_time_sheets]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"time_sheets": [time_sheet.as_dict() for time_sheet in deleted_time_sheets]}).as_response()
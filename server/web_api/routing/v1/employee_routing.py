@@ -38,13 +38,13 @@ class EmployeesRouter:
             :param session: The database session to use to register a new employee.
             :type session: sqlalchemy.orm.Session, optional
             :return: A response model containing the employee object that was created from the provided information with a generated employee ID and hashed password.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided request body contains any invalid parameters for the employee. This error may also be caused if the employee already exists in the database.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             created_employee = await create_employee(pyd_employee, session)
-            return ResponseModel(status.HTTP_201_CREATED, "success", {"employee": created_employee})
+            return ResponseModel(status.HTTP_201_CREATED, "success", {"employee": created_employee}).as_response()
 
     class Read:
         @staticmethod
@@ -58,13 +58,13 @@ class EmployeesRouter:
             :param session: The database session to use to retrieve all the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the number of employees found in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             employees_count = session.query(Employee).count()
-            return ResponseModel(status.HTTP_200_OK, "success", {"count": employees_count})
+            return ResponseModel(status.HTTP_200_OK, "success", {"count": employees_count}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.Employees.all_employees, status_code=status.HTTP_200_OK)
@@ -77,14 +77,14 @@ class EmployeesRouter:
             :param session: The database session to use to retrieve all the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: List of all employees found in the database with the total count of employees. If there are no employees in the database, an empty list and a count of 0 is returned.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             all_employees = await get_all_employees(session)
             all_employee_data = [employee.as_dict() for employee in all_employees]
-            return ResponseModel(status.HTTP_200_OK, "success", {"count": len(all_employees), "employees": all_employee_data})
+            return ResponseModel(status.HTTP_200_OK, "success", {"count": len(all_employees), "employees": all_employee_data}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.Employees.employee_token, status_code=status.HTTP_200_OK)
@@ -97,7 +97,7 @@ class EmployeesRouter:
             :param session: The database session to use to retrieve the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: The employee found in the database that matches the provided access token. If there are no matching employees, an error is shown.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid or the employee does not exist.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -105,7 +105,7 @@ class EmployeesRouter:
             employee = await get_user_from_token(token, session)
             if employee is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The employee does not exist!")
-            return ResponseModel(status.HTTP_200_OK, "success", {"employee": employee.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"employee": employee.as_dict()}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.Employees.employees, status_code=status.HTTP_200_OK)
@@ -120,7 +120,7 @@ class EmployeesRouter:
             :param session: The database session to use to retrieve the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: The employees found in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid, the provided request data is invalid, or one or more of the employees does not exist.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -130,7 +130,7 @@ class EmployeesRouter:
             employees = await get_multiple_employees(employee_ids.employee_ids, session)
             if employees is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="One or more employees in the provided list do not exist!")
-            return ResponseModel(status.HTTP_200_OK, "success", {"employees": employees})
+            return ResponseModel(status.HTTP_200_OK, "success", {"employees": employees}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.Employees.one_employee, status_code=status.HTTP_200_OK)
@@ -145,7 +145,7 @@ class EmployeesRouter:
             :param session: The database session to use to retrieve the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: The employees found in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid or the employee could not be retrieved.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -164,7 +164,7 @@ class EmployeesRouter:
                 full_employee_information["can_delete"] = True
             else:
                 full_employee_information["can_delete"] = False
-            return ResponseModel(status.HTTP_200_OK, "success", {"employee": full_employee_information})
+            return ResponseModel(status.HTTP_200_OK, "success", {"employee": full_employee_information}).as_response()
 
     class Update:
         @staticmethod
@@ -180,7 +180,7 @@ class EmployeesRouter:
             :param session: The database session to use to update the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the employee updated in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid or the employees could not be updated.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -188,7 +188,7 @@ class EmployeesRouter:
             updated_employees = await update_employees(multi_employee_update.employee_updates, session)
             if updated_employees is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="One or more provided parameters were invalid!")
-            return ResponseModel(status.HTTP_200_OK, "success", {"employees": [employee.as_dict() for employee in updated_employees]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"employees": [employee.as_dict() for employee in updated_employees]}).as_response()
 
         @staticmethod
         @router.put(API_ROUTES.Employees.one_employee, status_code=status.HTTP_200_OK)
@@ -205,7 +205,7 @@ class EmployeesRouter:
             :param session: The database session to use to update the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the employee updated in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid or the employee could not be updated.
             """
             if not await token_is_valid(token, ["employee"]):
@@ -218,7 +218,7 @@ class EmployeesRouter:
             updated_employee = await update_employee(employee_id.strip(), employee_update, session)
             if updated_employee is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="One or more provided parameters were invalid!")
-            return ResponseModel(status.HTTP_200_OK, "success", {"employee": updated_employee.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"employee": updated_employee.as_dict()}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.Employees.forgot_password)
@@ -231,13 +231,13 @@ class EmployeesRouter:
             :param session: The database session to use to update the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the employee updated in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the employee ID is invalid.
             """
             reset_code = await generate_reset_code(forgot_password, session)
             if reset_code is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unable to generate reset code. One or more provided parameters were invalid!")
-            return ResponseModel(status.HTTP_200_OK, "success", {"token": reset_code.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"token": reset_code.as_dict()}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.Employees.reset_password)
@@ -250,13 +250,13 @@ class EmployeesRouter:
             :param session: The database session to use to update the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing a success message if the password was updated.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the reset code or new password is invalid.
             """
             password_reset = await reset_account_password(reset_password, session)
             if password_reset is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unable to reset employee password. One or more provided parameters were invalid!")
-            return ResponseModel(status.HTTP_200_OK, "success")
+            return ResponseModel(status.HTTP_200_OK, "success").as_response()
 
         @staticmethod
         @router.put(API_ROUTES.Employees.password, status_code=status.HTTP_200_OK)
@@ -271,7 +271,7 @@ class EmployeesRouter:
             :param session: The database session to use to update the employee data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the employee updated in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid or the employee could not be updated.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -282,7 +282,7 @@ class EmployeesRouter:
                                                               session)
             if updated_employee is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="One or more provided parameters were invalid!")
-            return ResponseModel(status.HTTP_200_OK, "success")
+            return ResponseModel(status.HTTP_200_OK, "success").as_response()
 
     class Delete:
         @staticmethod
@@ -300,7 +300,7 @@ class EmployeesRouter:
             :param session: The database session to use to delete the employee records.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the number of employees deleted.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided request body contains invalid parameters.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -312,7 +312,7 @@ class EmployeesRouter:
                 for employee in employees:
                     session.delete(employee)
                 session.commit()
-            return ResponseModel(status.HTTP_200_OK, "success")
+            return ResponseModel(status.HTTP_200_OK, "success").as_response()
 
         @staticmethod
         @router.post(API_ROUTES.Employees.remove_employees, status_code=status.HTTP_200_OK)
@@ -330,13 +330,13 @@ class EmployeesRouter:
             :param session: The database session to use to delete the employee record.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the employee object that was deleted from the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided request body contains an invalid employee ID, or if the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             removed_employees = await remove_employees(employee_ids, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"employees": [employee.as_dict() for employee in removed_employees]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"employees": [employee.as_dict() for employee in removed_employees]}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.Employees.remove_one_employee, status_code=status.HTTP_200_OK)
@@ -353,7 +353,7 @@ class EmployeesRouter:
             :param session: The database session to use to delete the employee record.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the employee object that was deleted from the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided request body contains an invalid employee ID, or if the employee does not exist in the database.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -361,5 +361,5 @@ class EmployeesRouter:
             if employee_id is None or not isinstance(employee_id, str):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="The employee ID must be a valid string!")
             removed_employees = await remove_employees(employee_id.strip(), session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"employee": [employee.as_dict() for employee in removed_employees]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"employee": [employee.as_dict() for employee in removed_employees]}).as_response()
 
@@ -38,7 +38,7 @@ class ReportsRouter:
             :param session: The database session to use to create a new employee time sheet report.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the file path of the employee time sheet report that was created.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -59,7 +59,7 @@ class ReportsRouter:
             :param session: The database session to use to create a new employee time sheet report.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the file path of the employee time sheet report that was created.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -80,7 +80,7 @@ class ReportsRouter:
             :param session: The database session to use to create a new student care service report.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the file path of the student care service report that was created.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -101,7 +101,7 @@ class ReportsRouter:
             :param session: The database session to use to create a new student care service report.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the file path of the student care service report that was created.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -120,13 +120,13 @@ class ReportsRouter:
             :param token: The JSON Web Token responsible for authenticating the user to this endpoint.
             :type token: str, required
             :return: A response model containing the leave request that was completed and a success message.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["employee"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             await create_leave_request_email(leave_request)
-            return ResponseModel(status.HTTP_200_OK, "success")
+            return ResponseModel(status.HTTP_200_OK, "success").as_response(status.HTTP_201_CREATED)
 
     class Read:
         @staticmethod
@@ -138,10 +138,10 @@ class ReportsRouter:
             :param token: The JSON Web Token responsible for authenticating the user to this endpoint.
             :type token: str, required
             :return: A response model containing the list of leave request reasons.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication is invalid or there is an error retrieving the leave request reasons.
             """
             if not await token_is_valid(token, ["employee"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             reasons_list = await get_leave_request_reasons()
-            return ResponseModel(status.HTTP_200_OK, "success", {"reasons": reasons_list})
+            return ResponseModel(status.HTTP_200_OK, "success", {"reasons": reasons_list}).as_response()
@@ -34,10 +34,10 @@ class StudentCareRouter:
             the server configuration file.
 
             :return: A response model containing timeslots for before-care and after-care services.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             """
             timeslot_information = await get_care_timeslots()
-            return ResponseModel(status.HTTP_200_OK, "success", timeslot_information)
+            return ResponseModel(status.HTTP_200_OK, "success", timeslot_information).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.StudentCareKiosk.one_student_info, status_code=status.HTTP_200_OK)
@@ -50,7 +50,7 @@ class StudentCareRouter:
             :param session: The database session to use to retrieve a single student record.
             :type session: sqlalchemy.orm.session, optional
             :return: A single student from the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             """
             if student_id is None or not isinstance(student_id, str):
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The student ID must be a valid string!")
@@ -58,7 +58,7 @@ class StudentCareRouter:
             if student is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The student could not be retrieved.")
             full_student_information = student.as_limited_dict()
-            return ResponseModel(status.HTTP_200_OK, "success", {"student": full_student_information})
+            return ResponseModel(status.HTTP_200_OK, "success", {"student": full_student_information}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.StudentCareKiosk.one_student_care, status_code=status.HTTP_200_OK)
@@ -73,14 +73,14 @@ class StudentCareRouter:
             :param session: The database session to use to retrieve a single student record.
             :type session: sqlalchemy.orm.session, optional
             :return: A single student from the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             """
             if student_id is None or not isinstance(student_id, str):
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The student ID must be a valid string!")
             student_care = await get_one_student_care(student_id.strip(), care_date.strip(), session)
             if student_care is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The student care information not be retrieved.")
-            return ResponseModel(status.HTTP_200_OK, "success", {"care": student_care})
+            return ResponseModel(status.HTTP_200_OK, "success", {"care": student_care}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.StudentCare.care, status_code=status.HTTP_200_OK)
@@ -96,13 +96,13 @@ class StudentCareRouter:
             :param session: The database session to use to identify students that used the care service.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the list of students that used the care service.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the data provided in the request body is invalid, or the student is already checked in to the care service for the provided date.
             """
             if not await token_is_valid(token, ["employee"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             list_of_student_care = await get_care_students_by_grade(pyd_care_students, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"students": list_of_student_care})
+            return ResponseModel(status.HTTP_200_OK, "success", {"students": list_of_student_care}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.StudentCare.total_hours_records, status_code=status.HTTP_200_OK)
@@ -117,13 +117,13 @@ class StudentCareRouter:
             :param session: The database session to use to identify students that used the care service.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the list of students that used the care service.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the data provided in the request body is invalid, or the student is already checked in to the care service for the provided date.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             list_of_student_care = await get_total_student_care_for_period(pyd_care_students.start_date, pyd_care_students.end_date, pyd_care_students.grade, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"students": list_of_student_care})
+            return ResponseModel(status.HTTP_200_OK, "success", {"students": list_of_student_care}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.StudentCare.records, status_code=status.HTTP_200_OK)
@@ -138,13 +138,13 @@ class StudentCareRouter:
             :param session: The database session to use to collect student care records from the database.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the student care records.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the data provided in the request body is invalid.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             list_of_records = await get_student_care_records(pyd_care_students, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"records": list_of_records})
+            return ResponseModel(status.HTTP_200_OK, "success", {"records": list_of_records}).as_response()
 
     class Delete:
         @staticmethod
@@ -160,13 +160,13 @@ class StudentCareRouter:
             :param session: The database session to use to delete student care records from the database.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the success message.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the data provided in the request body is invalid.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             await delete_student_care_records(pyd_care_students, session)
-            return ResponseModel(status.HTTP_200_OK, "success")
+            return ResponseModel(status.HTTP_200_OK, "success").as_response()
 
     class Service:
         @staticmethod
@@ -183,11 +183,11 @@ class StudentCareRouter:
             :param session: The database session to use to check in a student.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing information regarding the student and the check-in time and date that has been registered in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the data provided in the request body is invalid, or the student is already checked in to the care service for the provided date.
             """
             checked_in_student = await check_in_student(pyd_student_checkin, session)
-            return ResponseModel(status.HTTP_201_CREATED, "success", {"check-in": checked_in_student.as_dict()})
+            return ResponseModel(status.HTTP_201_CREATED, "success", {"check-in": checked_in_student.as_dict()}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.StudentCare.check_out, status_code=status.HTTP_200_OK)
@@ -203,8 +203,8 @@ class StudentCareRouter:
             :param session: The database session to use to check out a student.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing information regarding the student and the check-out time and date that has been registered in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the data provided in the request body is invalid, or the student is already checked out of the care service for the provided date.
             """
             checked_out_student = await check_out_student(pyd_student_checkout, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"check-out": checked_out_student.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"check-out": checked_out_student.as_dict()}).as_response()
@@ -36,13 +36,13 @@ class StudentGradesRouter:
             :param session: The database session to use to create a new student record in the database.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the file path of the employee time sheet report that was created.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             new_student_grade = await create_student_grade(student_grade, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"grade": new_student_grade.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"grade": new_student_grade.as_dict()}).as_response(status.HTTP_201_CREATED)
 
     class Read:
         @staticmethod
@@ -56,13 +56,13 @@ class StudentGradesRouter:
             :param session: The database session to use to retrieve all student grade records in the database.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the list of all the student grades that was created.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["employee"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             student_grades = await retrieve_all_grades(session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"grades": [student_grade.as_dict() for student_grade in student_grades]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"grades": [student_grade.as_dict() for student_grade in student_grades]}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.StudentGrades.one_grade, status_code=status.HTTP_200_OK)
@@ -77,13 +77,13 @@ class StudentGradesRouter:
             :param session: The database session to use to retrieve one student grade record in the database.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the student grade that was retrieved.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             grade = await retrieve_one_grade(grade_name, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"grade": grade.as_detail_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"grade": grade.as_detail_dict()}).as_response()
 
     class Delete:
         @staticmethod
@@ -99,10 +99,10 @@ class StudentGradesRouter:
             :param session: The database session to use to delete a student grade record in the database.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the name of the deleted student grade.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             removed_grade = await remove_student_grade(student_grade, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"grade": removed_grade.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"grade": removed_grade.as_dict()}).as_response()
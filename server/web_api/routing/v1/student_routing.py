@@ -39,13 +39,13 @@ class StudentsRouter:
             :param session: The database session to use to create a new student record in the database.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the student object that was created and inserted into the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the request body contains any invalid parameters, or the data provided is formatted incorrectly.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             created_student = await create_student(pyd_student, session)
-            return ResponseModel(status.HTTP_201_CREATED, "success", {"student": created_student})
+            return ResponseModel(status.HTTP_201_CREATED, "success", {"student": created_student}).as_response()
 
     class Read:
         @staticmethod
@@ -59,12 +59,12 @@ class StudentsRouter:
             :param session: The database session to use to retrieve the number of student records.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the number of students in the database. The count will be 0 if there are no students registered in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             students_count = session.query(Student).count()
-            return ResponseModel(status.HTTP_200_OK, "success", {"count": students_count})
+            return ResponseModel(status.HTTP_200_OK, "success", {"count": students_count}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.Students.students, status_code=status.HTTP_200_OK)
@@ -77,7 +77,7 @@ class StudentsRouter:
             :param session: The database session to use to retrieve all student records.
             :type session: sqlalchemy.orm.session, optional
             :return: List of all the students in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
@@ -86,7 +86,7 @@ class StudentsRouter:
             for row in students:
                 item: Student = row
                 all_students.append(item.as_dict())
-            return ResponseModel(status.HTTP_200_OK, "success", {"students": all_students})
+            return ResponseModel(status.HTTP_200_OK, "success", {"students": all_students}).as_response()
 
         @staticmethod
         @router.get(API_ROUTES.Students.one_student, status_code=status.HTTP_200_OK)
@@ -101,7 +101,7 @@ class StudentsRouter:
             :param session: The database session to use to retrieve a single student record.
             :type session: sqlalchemy.orm.session, optional
             :return: A single student from the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             """
             if not await token_is_valid(token, ["employee"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
@@ -116,7 +116,7 @@ class StudentsRouter:
                 full_student_information["can_delete"] = True
             else:
                 full_student_information["can_delete"] = False
-            return ResponseModel(status.HTTP_200_OK, "success", {"student": full_student_information})
+            return ResponseModel(status.HTTP_200_OK, "success", {"student": full_student_information}).as_response()
 
     class Update:
         @staticmethod
@@ -132,7 +132,7 @@ class StudentsRouter:
             :param session: The database session to use to update multiple student data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the multiple student updated data in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid or the students could not be updated.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -140,7 +140,7 @@ class StudentsRouter:
             updated_students = await update_students(multi_student_update.student_updates, session)
             if updated_students is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="One or more provided parameters were invalid!")
-            return ResponseModel(status.HTTP_200_OK, "success", {"students": [student.as_dict() for student in updated_students]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"students": [student.as_dict() for student in updated_students]}).as_response()
 
         @staticmethod
         @router.put(API_ROUTES.Students.one_student, status_code=status.HTTP_200_OK)
@@ -157,7 +157,7 @@ class StudentsRouter:
             :param session: The database session to use to update the student data.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the student updated in the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the authentication token is invalid or the student could not be updated.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -167,7 +167,7 @@ class StudentsRouter:
             updated_student = await update_student(student_id.strip(), student_update, session)
             if updated_student is None:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="One or more provided parameters were invalid!")
-            return ResponseModel(status.HTTP_200_OK, "success", {"student": updated_student.as_dict()})
+            return ResponseModel(status.HTTP_200_OK, "success", {"student": updated_student.as_dict()}).as_response()
 
     class Delete:
         @staticmethod
@@ -186,13 +186,13 @@ class StudentsRouter:
             :param session: The database session to use to delete the student record.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the student object that was deleted from the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided request body contains an invalid student ID, or if the student does not exist in the database.
             """
             if not await token_is_valid(token, ["administrator"]):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
             removed_students = await remove_students(student_ids, session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"students": [student.as_dict() for student in removed_students]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"students": [student.as_dict() for student in removed_students]}).as_response()
 
         @staticmethod
         @router.post(API_ROUTES.Students.remove_one_student, status_code=status.HTTP_200_OK)
@@ -209,7 +209,7 @@ class StudentsRouter:
             :param session: The database session to use to delete the student record.
             :type session: sqlalchemy.orm.session, optional
             :return: A response model containing the student object that was deleted from the database.
-            :rtype: server.web_api.models.ResponseModel
+            :rtype: fastapi.responses.Response
             :raises HTTPException: If the provided request body contains an invalid student ID, or if the student does not exist in the database.
             """
             if not await token_is_valid(token, ["administrator"]):
@@ -217,4 +217,4 @@ class StudentsRouter:
             if student_id is None or not isinstance(student_id, str):
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="The employee ID must be a valid string!")
             removed_students = await remove_students(student_id.strip(), session)
-            return ResponseModel(status.HTTP_200_OK, "success", {"student": [student.as_dict() for student in removed_students]})
+            return ResponseModel(status.HTTP_200_OK, "success", {"student": [student.as_dict() for student in removed_students]}).as_response()
@@ -1,3 +1,8 @@
+import os
+import hashlib
+import orjson
+from anyio.to_thread import current_default_thread_limiter
+from functools import lru_cache
 from fastapi.exceptions import RequestValidationError
 
 from server.lib.config_manager import ConfigManager
@@ -8,8 +13,9 @@ from server.web_api.web_security import add_token_to_blacklist, create_access_to
 from server.lib.database_controllers.employee_interface import get_employee
 from fastapi import FastAPI, Depends, status, HTTPException, Request
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from pydantic import ValidationError
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 from fastapi.security.oauth2 import OAuth2PasswordRequestForm
 from fastapi.staticfiles import StaticFiles
 from server.web_api.api_routes import API_ROUTES
@@ -17,50 +23,80 @@ from server.lib.utils.employee_utils import verify_employee_password
 from server.lib.strings import META_VERSION, ROOT_DIR
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-web_app = FastAPI(
-    title="PCA Web API",
-    description="This is the REST API for the PCA Timesheet & Student Care Service server built with FastAPI",
-    version=META_VERSION,
-    redoc_url=None
-)
-web_app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[f"{'https' if ConfigManager().config().getboolean('API Server', 'use_https') else 'http'}://{cors_domain.strip()}" for cors_domain in ConfigManager().config()['API Server']['cors_domains'].lower().strip().split(",")],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE"],
-    allow_headers=["Origin", "Accept", "Content-Type", "Authorization", "Access-Control-Allow-Origin"]
-)
-if ConfigManager().config().getboolean('API Server', 'use_https'):
-    from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
-
-    web_app.add_middleware(HTTPSRedirectMiddleware)
-if ConfigManager().config().getboolean('API Server', 'enable_docs'):
-    web_app.mount("/wiki",
-                  StaticFiles(directory=f"{ROOT_DIR}/docs/build/html", html=True),
-                  name="wiki")
-web_app.mount("/favicon.ico", FileResponse(f"{ROOT_DIR}/web_api/static/favicon.ico"))
-web_app.include_router(core_routing.router)
-web_app.include_router(employee_routing.router)
-web_app.include_router(employee_hours_routing.router)
-web_app.include_router(student_routing.router)
-web_app.include_router(student_care_routing.router)
-web_app.include_router(student_grade_routing.router)
-web_app.include_router(reports_routing.router)
-web_app.include_router(email_routing.router)
-
-
-@web_app.get(API_ROUTES.index, status_code=status.HTTP_200_OK)
+# The detail message returned when a request is sent to an endpoint with a method that is not allowed.
+DETAIL_METHOD_NOT_ALLOWED = "The request to the endpoint is invalid. This endpoint does not exist or is not allowed!"
+
+# The pre-serialized body of the error responses, the error messages are encoded and inserted into the body for each error response.
+ERROR_RESPONSE_TEMPLATE = b'{"status":%d,"message":%b,"data":{"error_message":%b,"detail_message":%b}}'
+
+# The error messages of the validation error responses, looked up by the type of validation error that occurred.
+VALIDATION_ERROR_MESSAGES = {
+    ValidationError: "Error: Validation Error",
+    RequestValidationError: "Error: Request Validation Error"
+}
+
+# The serialized body of the index page response, the index page content never changes so it is only serialized once.
+INDEX_RESPONSE_BODY = orjson.dumps(ResponseModel(status.HTTP_200_OK, "success", {"message": {}}).as_dict())
+
+# The favicon of the API server, the icon is read once instead of reading the file from disk on every request.
+with open(f"{ROOT_DIR}/web_api/static/favicon.ico", "rb") as favicon_file:
+    FAVICON_BYTES = favicon_file.read()
+# The entity tag and cache headers of the favicon, so that clients can revalidate a cached icon without downloading it again.
+FAVICON_ETAG = f'"{hashlib.md5(FAVICON_BYTES, usedforsecurity=False).hexdigest()}"'
+FAVICON_HEADERS = {"Cache-Control": "public, max-age=86400", "ETag": FAVICON_ETAG}
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    This class serves static files in the same way as the base static files application,
+    but it also allows browsers to cache every served file for a day.
+    It is used to serve the API server documentation, which only changes when the server is updated.
+    """
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=86400"
+        return response
+
+
+async def configure_thread_limiter():
+    """
+    Raises the number of worker threads that the API server can use to run synchronous dependencies and handlers.
+    The thread limit is read from the server configuration file, and the default thread limit scales with the number of CPU cores.
+    The default thread limiter is bound to the running event loop, so this must be called on server startup.
+
+    :return: None
+    """
+    current_default_thread_limiter().total_tokens = ConfigManager().config().getint('API Server', 'thread_limit', fallback=max(40, (os.cpu_count() or 4) * 10))
+
+
 async def serve_index():
     """
     Serves the index page of the uvicorn API server with the original request sent to the server.
 
     :return: The index page of the uvicorn API server.
-    :rtype: server.web_api.models.ResponseModel
+    :rtype: fastapi.responses.Response
     """
-    return ResponseModel(status.HTTP_200_OK, "success", {"message": {}})
+    return Response(INDEX_RESPONSE_BODY, media_type="application/json")
+
+
+async def serve_favicon(request: Request):
+    """
+    Serves the favicon of the uvicorn API server from memory, and allows clients to cache the icon for a day.
+    If the client already has the current favicon cached, an empty response is sent instead.
+
+    :param request: The HTTP request sent to the server, which may contain the entity tag of a cached favicon.
+    :type request: fastapi.Request
+    :return: The favicon of the uvicorn API server, or an empty response if the cached favicon is still valid.
+    :rtype: fastapi.responses.Response
+    """
+    # The If-None-Match header can list several entity tags separated by commas, and weak entity tags are compared without the W/ prefix.
+    cached_etags = {etag.strip().removeprefix("W/") for etag in request.headers.get("if-none-match", "").split(",")}
+    if "*" in cached_etags or FAVICON_ETAG in cached_etags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=FAVICON_HEADERS)
+    return Response(FAVICON_BYTES, media_type="image/x-icon", headers=FAVICON_HEADERS)
 
 
-@web_app.post(API_ROUTES.login, status_code=status.HTTP_200_OK)
 async def login(data: OAuth2PasswordRequestForm = Depends()):
     """
     An endpoint to handle login requests to the server which verifies employee accounts before allowing access.
@@ -68,7 +104,7 @@ async def login(data: OAuth2PasswordRequestForm = Depends()):
     :param data: The username and password of the employee account.
     :type data: OAuth2PasswordRequestForm
     :return: A response model containing basic employee account information and access token information.
-    :rtype: server.web_api.models.ResponseModel
+    :rtype: fastapi.responses.Response
     :raises HTTPException: If the username or password is invalid, the employee account is disabled, or a network connection cannot be established.
     """
     username = data.username.strip()
@@ -84,10 +120,9 @@ async def login(data: OAuth2PasswordRequestForm = Depends()):
     if not employee_user.EmployeeEnabled:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="The user account is currently disabled. Please inform your system administrator.")
     access_token_dict = await create_access_token(employee_user)
-    return ResponseModel(status.HTTP_200_OK, "success", {**access_token_dict})
+    return ResponseModel(status.HTTP_200_OK, "success", {**access_token_dict}).as_response()
 
 
-@web_app.get(API_ROUTES.me, status_code=status.HTTP_200_OK)
 async def logged_in_welcome(token: str = Depends(oauth_scheme)):
     """
     An endpoint to welcome a signed-in account and return the first and last name information
@@ -96,7 +131,7 @@ async def logged_in_welcome(token: str = Depends(oauth_scheme)):
     :param token: The access token of the signed-in user.
     :type token: str, required
     :return: A response model containing a success message and the first and last name of the signed in account.
-    :rtype: server.web_api.models.ResponseModel
+    :rtype: fastapi.responses.Response
     :raises HTTPException: If the user access token has expired or is invalid.
     """
     if not await token_is_valid(token, ["employee"]):
@@ -104,10 +139,9 @@ async def logged_in_welcome(token: str = Depends(oauth_scheme)):
     user = await get_user_from_token(token, )
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token is invalid or expired!")
-    return ResponseModel(status.HTTP_200_OK, "logged in successfully!", {"user": f"{user.FirstName} {user.LastName}".title()})
+    return ResponseModel(status.HTTP_200_OK, "logged in successfully!", {"user": f"{user.FirstName} {user.LastName}".title()}).as_response()
 
 
-@web_app.post(API_ROUTES.logout, status_code=status.HTTP_200_OK)
 async def logout(token: str = Depends(oauth_scheme)):
     """
     An endpoint that logs out a signed-in employee account and invalidates and blacklists the access token to prevent
@@ -116,7 +150,7 @@ async def logout(token: str = Depends(oauth_scheme)):
     :param token: The access token of the signed-in user.
     :type token: str, required
     :return: A response model containing a success message.
-    :rtype: server.web_api.models.ResponseModel
+    :rtype: fastapi.responses.Response
     :raises HTTPException: If the user access token has expired or is invalid.
     """
     token_blacklist_check = await add_token_to_blacklist(token)
@@ -124,28 +158,50 @@ async def logout(token: str = Depends(oauth_scheme)):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Token is invalid or expired!")
     elif not token_blacklist_check:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Token already invalidated!")
-    return ResponseModel(status.HTTP_200_OK, "logged out successfully!")
+    return ResponseModel(status.HTTP_200_OK, "logged out successfully!").as_response()
 
 
-@web_app.get(API_ROUTES.routes, status_code=status.HTTP_200_OK)
-async def get_api_routes(token: str = Depends(oauth_scheme)):
+async def get_api_routes(request: Request, token: str = Depends(oauth_scheme)):
     """
     An endpoint that retrieves all the API routes registered in the API server.
     This is a useful endpoint to verify if API routes are successfully loaded in and online.
 
+    :param request: The HTTP request sent to the server, which references the API server application.
+    :type request: fastapi.Request
     :param token: The access token of the signed-in user.
     :type token: str, required
     :return: A response model containing a success message and the list of all active API routes.
-    :rtype: server.web_api.models.ResponseModel
+    :rtype: fastapi.responses.Response
     :raises HTTPException: If the user access token has expired or is invalid.
     """
     if not await token_is_valid(token, ["administrator"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired or is invalid!")
-    routes_list = [{"path": route.path, "name": route.name} for route in web_app.routes]
-    return ResponseModel(status.HTTP_200_OK, "routes retrieved successfully!", {"routes": routes_list})
+    routes_list = [{"path": route.path, "name": route.name} for route in request.app.routes]
+    return ResponseModel(status.HTTP_200_OK, "routes retrieved successfully!", {"routes": routes_list}).as_response()
+
+
+def create_error_response(request: Request, status_code: int, message: str, detail_message: str) -> Response:
+    """
+    Creates the JSON error response returned by the exception handlers.
+    The response body has the same layout as a serialized response model, but it is built from a pre-serialized template
+    so that only the error messages need to be encoded on every failed request.
+
+    :param request: The HTTP request that failed and resulted in an error.
+    :type request: fastapi.Request
+    :param status_code: The HTTP status code of the error response.
+    :type status_code: int
+    :param message: The error message that accompanies the HTTP status code.
+    :type message: str
+    :param detail_message: The detailed description of the error.
+    :type detail_message: str
+    :return: A JSON message containing the error code, error message, and a detailed exception description.
+    :rtype: fastapi.responses.Response
+    """
+    body = ERROR_RESPONSE_TEMPLATE % (status_code, orjson.dumps(message),
+                                      orjson.dumps(f"Failed to execute: {request.method}: {request.url}"), orjson.dumps(detail_message))
+    return Response(body, status_code=status_code, media_type="application/json")
 
 
-@web_app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """
     The general exception handler that catches server errors from HTTP requests not caught by
@@ -158,92 +214,107 @@ async def general_exception_handler(request: Request, exc: Exception):
     :param exc: The exception that occurred as a result of processing the HTTP request.
     :type exc: Exception
     :return: A JSON message containing the error code, error message, and a detailed exception description.
-    :rtype: fastapi.responses.JSONResponse
+    :rtype: fastapi.responses.Response
     """
-    resp = ResponseModel(status.HTTP_500_INTERNAL_SERVER_ERROR, "Error: Internal Server Error",
-                         {"error_message": f"Failed to execute: {request.method}: {request.url}",
-                          "detail_message": str(exc)})
-    return JSONResponse(resp.as_dict(), media_type="application/json", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return create_error_response(request, status.HTTP_500_INTERNAL_SERVER_ERROR, "Error: Internal Server Error", str(exc))
 
 
-@web_app.exception_handler(HTTPException)
-async def general_http_exception(request: Request, exc: HTTPException):
+async def general_http_exception(request: Request, exc: StarletteHTTPException):
     """
     The general exception handler that catches all HTTP errors from
-    HTTP requests as a result of improper formatting or data provided in the request.
+    HTTP requests as a result of improper formatting or data provided in the request,
+    as well as the HTTP errors raised by the uvicorn server itself.
     This exception handler should never be called manually in your code.
 
     :param request: The HTTP request that failed and resulted in an error.
     :type request: fastapi.Request
     :param exc: The exception that occurred as a result of processing the HTTP request.
-    :type exc: fastapi.HTTPException
+    :type exc: fastapi.HTTPException | starlette.exceptions.HTTPException
     :return: A JSON message containing the error code, error message, and a detailed exception description.
-    :rtype: fastapi.responses.JSONResponse
+    :rtype: fastapi.responses.Response
     """
-    detail_error_message = str(exc.detail)
     if exc.status_code == 404:
         return RedirectResponse(API_ROUTES.index)
     if exc.status_code == 405:
-        detail_error_message = "The request to the endpoint is invalid. This endpoint does not exist or is not allowed!"
-    resp = ResponseModel(exc.status_code, "Error: HTTP Exception Error",
-                         {"error_message": f"Failed to execute: {request.method}: {request.url}",
-                          "detail_message": detail_error_message})
-    return JSONResponse(resp.as_dict(), media_type="application/json", status_code=exc.status_code)
-
+        return create_error_response(request, exc.status_code, "Error: HTTP Exception Error", DETAIL_METHOD_NOT_ALLOWED)
+    return create_error_response(request, exc.status_code, "Error: HTTP Exception Error", str(exc.detail))
 
-@web_app.exception_handler(StarletteHTTPException)
-async def starlette_http_exception(request: Request, exc: StarletteHTTPException):
-    """
-    The general exception handler that catches HTTP errors from the uvicorn server.
-    If for some reason this exception handler is caught instead of the primary exception handler for all HTTP exceptions,
-    then this handler will redirect the exception to the appropriate handler.
-    This exception handler should never be called manually in your code.
 
-    :param request: The HTTP request that failed and resulted in an error.
-    :type request: fastapi.Request
-    :param exc: The exception that occurred as a result of processing the HTTP request.
-    :type exc: starlette.exceptions.HTTPException
-    :return: A JSON message containing the error code, error message, and a detailed exception description.
-    :rtype: fastapi.responses.JSONResponse
-    """
-    return await general_http_exception(request, exc)
-
-
-@web_app.exception_handler(ValidationError)
 async def general_validation_exception(request: Request, exc: ValidationError):
     """
-    The general exception handler that catches validation errors with data sent
-    to the server in an HTTP request. This exception is caused by the HTTP request
-    sent to the server and is the fault of the requester, not the server.
+    The general exception handler that catches validation errors with data sent to the server in an HTTP request,
+    and validation errors with improper formatting of requests sent to the server. The error message is looked up
+    from the type of validation error. This exception is caused by the HTTP request sent to the server and is the fault of the requester, not the server.
+    This exception handler should never be called manually in your code.
 
     :param request: HTTP request that failed and resulted in an error.
     :type request: fastapi.Request
     :param exc: The exception that occurred as a result of processing the HTTP request.
-    :type exc: fastapi.exceptions.ValidationError
+    :type exc: fastapi.exceptions.ValidationError | fastapi.exceptions.RequestValidationError
     :return: A JSON message containing the error code, error message, and a detailed exception description.
-    :rtype: fastapi.responses.JSONResponse
+    :rtype: fastapi.responses.Response
     """
-    resp = ResponseModel(status.HTTP_400_BAD_REQUEST, "Error: Validation Error",
-                         {"error_message": f"Failed to execute: {request.method}: {request.url}",
-                          "detail_message": str(exc)})
-    return JSONResponse(resp.as_dict(), media_type="application/json", status_code=status.HTTP_400_BAD_REQUEST)
+    return create_error_response(request, status.HTTP_400_BAD_REQUEST, VALIDATION_ERROR_MESSAGES.get(type(exc), "Error: Validation Error"), str(exc))
 
 
-@web_app.exception_handler(RequestValidationError)
-async def general_request_validation_exception(request: Request, exc: RequestValidationError):
+@lru_cache(maxsize=1)
+def create_app() -> FastAPI:
     """
-    The general exception handler that catches validation errors with improper formatting of requests
-    sent to the server. This exception is caused by the HTTP request
-    sent to the server and is the fault of the requester, not the server.
+    Creates the FastAPI application of the API server with the middleware, routers, endpoints, and exception handlers.
+    The application is only created on the first call, every following call returns the same application instance.
+    Use this application factory instead of building the application when the module is imported.
 
-    :param request: HTTP request that failed and resulted in an error.
-    :type request: fastapi.Request
-    :param exc: The exception that occurred as a result of processing the HTTP request.
-    :type exc: fastapi.exceptions.RequestValidationError
-    :return: A JSON message containing the error code, error message, and a detailed exception description.
-    :rtype: fastapi.responses.JSONResponse
+    :return: The FastAPI application of the API server.
+    :rtype: fastapi.FastAPI
     """
-    resp = ResponseModel(status.HTTP_400_BAD_REQUEST, "Error: Request Validation Error",
-                         {"error_message": f"Failed to execute: {request.method}: {request.url}",
-                          "detail_message": str(exc)})
-    return JSONResponse(resp.as_dict(), media_type="application/json", status_code=status.HTTP_400_BAD_REQUEST)
+    api_config = ConfigManager().config()['API Server']
+    use_https = api_config.getboolean('use_https')
+    web_app = FastAPI(
+        title="PCA Web API",
+        description="This is the REST API for the PCA Timesheet & Student Care Service server built with FastAPI",
+        version=META_VERSION,
+        redoc_url=None,
+        default_response_class=ORJSONResponse
+    )
+    # Compress larger responses, such as employee and student lists or CSV reports, for clients that accept gzip encoding.
+    web_app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    web_app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[f"{'https' if use_https else 'http'}://{cors_domain.strip()}" for cors_domain in api_config['cors_domains'].lower().strip().split(",")],
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE"],
+        allow_headers=["Origin", "Accept", "Content-Type", "Authorization", "Access-Control-Allow-Origin"],
+        # Allow browsers to cache the preflight responses for a day, so that most cross-origin requests skip the preflight request.
+        max_age=86400
+    )
+    if use_https:
+        from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
+
+        web_app.add_middleware(HTTPSRedirectMiddleware)
+    if api_config.getboolean('enable_docs'):
+        web_app.mount("/wiki",
+                      CachedStaticFiles(directory=f"{ROOT_DIR}/docs/build/html", html=True),
+                      name="wiki")
+    web_app.include_router(core_routing.router)
+    web_app.include_router(employee_routing.router)
+    web_app.include_router(employee_hours_routing.router)
+    web_app.include_router(student_routing.router)
+    web_app.include_router(student_care_routing.router)
+    web_app.include_router(student_grade_routing.router)
+    web_app.include_router(reports_routing.router)
+    web_app.include_router(email_routing.router)
+    web_app.add_event_handler("startup", configure_thread_limiter)
+
+    web_app.add_api_route(API_ROUTES.index, serve_index, methods=["GET"], status_code=status.HTTP_200_OK)
+    web_app.add_api_route(API_ROUTES.favicon, serve_favicon, methods=["GET"], include_in_schema=False)
+    web_app.add_api_route(API_ROUTES.login, login, methods=["POST"], status_code=status.HTTP_200_OK)
+    web_app.add_api_route(API_ROUTES.me, logged_in_welcome, methods=["GET"], status_code=status.HTTP_200_OK)
+    web_app.add_api_route(API_ROUTES.logout, logout, methods=["POST"], status_code=status.HTTP_200_OK)
+    web_app.add_api_route(API_ROUTES.routes, get_api_routes, methods=["GET"], status_code=status.HTTP_200_OK)
+
+    web_app.add_exception_handler(Exception, general_exception_handler)
+    web_app.add_exception_handler(HTTPException, general_http_exception)
+    web_app.add_exception_handler(StarletteHTTPException, general_http_exception)
+    web_app.add_exception_handler(ValidationError, general_validation_exception)
+    web_app.add_exception_handler(RequestValidationError, general_validation_exception)
+    return web_app
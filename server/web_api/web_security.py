@@ -21,6 +21,12 @@ from server.lib.database_manager import get_db_session
 from sqlalchemy.exc import IntegrityError
 
 oauth_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
+# The number of seconds that an access token that is not blacklisted is trusted without checking the token blacklist again,
+# and the maximum number of access tokens that are kept in the cache of verified tokens.
+TOKEN_CACHE_TTL = 30
+TOKEN_CACHE_SIZE = 1024
+# The cache of access tokens that were verified to not be blacklisted, mapped to the time that the cached entry expires.
+verified_token_cache = {}
 
 
 async def create_access_token(employee_user: Employee) -> Dict[str, str]:
@@ -85,7 +91,7 @@ async def token_is_valid(token: str, scopes: List[str]) -> bool:
     :rtype: bool
     :raises HTTPException: If the access token is invalid or expired, or the employee account doesn't have the appropriate permission scopes.
     """
-    if None in (token, scopes):
+    if token is None or scopes is None:
         return False
     try:
         token_data = jwt.decode(token, ConfigManager().config()['API Server']['server_secret'], algorithms=["HS256"])
@@ -96,19 +102,22 @@ async def token_is_valid(token: str, scopes: List[str]) -> bool:
     except PyJWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authorization token is invalid! The authorization token might be incorrectly formatted.")
 
-    # Remove expired tokens before checking validity.
+    # Only check the token blacklist if the token hasn't been verified recently.
     cur_time = int(datetime.utcnow().timestamp())
-    session = next(get_db_session())
-    session.query(TokenBlacklist).filter(
-        TokenBlacklist.Exp <= cur_time
-    ).delete()
-    session.commit()
-
-    blacklist_token = session.query(TokenBlacklist).filter(
-        TokenBlacklist.AccessToken == token
-    ).first()
-    if blacklist_token:
-        return False
+    if verified_token_cache.get(token, 0) <= cur_time:
+        # Remove expired tokens before checking validity.
+        session = next(get_db_session())
+        session.query(TokenBlacklist).filter(
+            TokenBlacklist.Exp <= cur_time
+        ).delete()
+        session.commit()
+
+        blacklist_token = session.query(TokenBlacklist).filter(
+            TokenBlacklist.AccessToken == token
+        ).first()
+        if blacklist_token:
+            return False
+        cache_verified_token(token, min(cur_time + TOKEN_CACHE_TTL, token_data.get("exp", cur_time)), cur_time)
 
     for scope in scopes:
         if scope not in token_scopes:
@@ -116,6 +125,27 @@ async def token_is_valid(token: str, scopes: List[str]) -> bool:
     return True
 
 
+def cache_verified_token(token: str, cache_expiration: int, cur_time: int):
+    """
+    This utility method caches an access token that was verified to not be blacklisted until the provided expiration time.
+    If the cache is full, the expired entries are removed first, and the entire cache is cleared if it is still full.
+
+    :param token: The access token of the employee account that was verified.
+    :type token: str, required
+    :param cache_expiration: The timestamp at which the cached access token must be verified again.
+    :type cache_expiration: int, required
+    :param cur_time: The current timestamp, used to remove expired entries from the cache.
+    :type cur_time: int, required
+    :return: None
+    """
+    if len(verified_token_cache) >= TOKEN_CACHE_SIZE:
+        for cached_token in [cached_token for cached_token, expiration in verified_token_cache.items() if expiration <= cur_time]:
+            del verified_token_cache[cached_token]
+        if len(verified_token_cache) >= TOKEN_CACHE_SIZE:
+            verified_token_cache.clear()
+    verified_token_cache[token] = cache_expiration
+
+
 async def add_token_to_blacklist(token: str) -> bool:
     """
     This utility method adds the provided access token to the access token blacklist.
@@ -136,6 +166,8 @@ async def add_token_to_blacklist(token: str) -> bool:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authorization token is invalid! Unable to invalidate a malformed token.")
 
     blacklist_token = TokenBlacklist(token, token_data['iat'], token_data['exp'])
+    # Stop trusting the cached verification of the token as soon as it is blacklisted.
+    verified_token_cache.pop(token, None)
     try:
         session = next(get_db_session())
         session.add(blacklist_token)
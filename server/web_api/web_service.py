@@ -1,19 +1,28 @@
 import contextlib
 import threading
-import time
 import uvicorn
 
 from server.lib.config_manager import ConfigManager
-from server.web_api.web_app import web_app
+from server.web_api.web_app import create_app
 from server.lib.logging_manager import LoggingManager
 from server.lib.strings import LOG_ORIGIN_API
 
+# The logging manager instance and the info log level used by the web service, these are bound once when the module is loaded.
+_LOG = LoggingManager()
+_INFO = LoggingManager.LogLevel.LOG_INFO
+# The number of seconds that idle keep-alive connections are held open, and the maximum number of connections and tasks
+# that the server handles at once before responding to new requests with HTTP 503 errors.
+WEB_KEEP_ALIVE_TIMEOUT = 75
+WEB_CONCURRENCY_LIMIT = 1024
+
 
 class UvicornServer(uvicorn.Server):
     """
     The internal uvicorn server handler class that overrides the base uvicorn server
     configuration with updated thread handling.
-    Do not modify this code!
+    The server runs in a background thread, and the startup event is set once the server has finished starting up or failed to start,
+    so that ``run_in_thread`` waits on the event instead of polling the server state.
+    ``run_in_thread`` raises a RuntimeError if the server fails to start or the server thread exits before starting up.
     """
 
     def install_signal_handlers(self) -> None:
@@ -22,14 +31,27 @@ class UvicornServer(uvicorn.Server):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.should_exit = False
+        self.startup_event = threading.Event()
+
+    async def startup(self, sockets=None) -> None:
+        # Notify the thread waiting in run_in_thread once the server has finished starting up, or failed to start.
+        try:
+            await super().startup(sockets=sockets)
+        finally:
+            self.startup_event.set()
 
     @contextlib.contextmanager
     def run_in_thread(self):
         thread = threading.Thread(target=self.run)
         thread.start()
         try:
-            while not self.started:
-                time.sleep(0.01)
+            # Wait for the server to start, the server thread can also exit before startup, such as when the SSL certificate or key is invalid.
+            while not self.startup_event.wait(0.1):
+                if not thread.is_alive():
+                    raise RuntimeError('The API server failed to start, please check the API server settings in the server configuration file!')
+            # The startup event is also set when the server fails to start, such as when the port is already in use.
+            if not self.started:
+                raise RuntimeError('The API server failed to start, please check that the host and port are available!')
             yield
         except KeyboardInterrupt:
             self.should_exit = True
@@ -71,7 +93,7 @@ class WebService:
         self.ssl_cert = ssl_cert
         self.ssl_key = ssl_key
         self.web_server = None
-        self.stop_flag = False
+        self.stop_event = threading.Event()
         self.debug_mode = debug_mode
 
     def initialize_web(self):
@@ -82,35 +104,41 @@ class WebService:
         :return: None
         """
         config = uvicorn.Config(
-            web_app,
+            create_app(),
             host=self.host,
             port=self.port,
             reload=False,
-            loop="asyncio",
+            # Use the uvloop event loop and the httptools HTTP parser when they are installed, otherwise use asyncio and h11.
+            loop="auto",
+            http="auto",
             ssl_certfile=self.ssl_cert if self.use_https else None,
             ssl_keyfile=self.ssl_key if self.use_https else None,
-            timeout_keep_alive=99999,
+            timeout_keep_alive=WEB_KEEP_ALIVE_TIMEOUT,
+            limit_concurrency=WEB_CONCURRENCY_LIMIT,
             log_level='info' if self.debug_mode else 'critical',
+            # Only log every request in debug mode, and skip adding the server header to every response.
+            access_log=self.debug_mode,
+            server_header=False,
         )
         self.web_server = UvicornServer(config=config)
         with self.web_server.run_in_thread():
-            LoggingManager().log(LoggingManager.LogLevel.LOG_INFO, f"Initializing API Server on: {self.host}:{self.port}/api/v1/", origin=LOG_ORIGIN_API, no_print=False)
+            _LOG.log(_INFO, f"Initializing API Server on: {self.host}:{self.port}/api/v1/", origin=LOG_ORIGIN_API, no_print=False)
             if ConfigManager().config().getboolean('API Server', 'enable_docs'):
-                LoggingManager().log(LoggingManager.LogLevel.LOG_INFO, f"Initializing Server API Documentation on: {self.host}:{self.port}/docs/", origin=LOG_ORIGIN_API,
-                                     no_print=False)
-            while not self.stop_flag:
-                try:
-                    time.sleep(0.01)
-                except KeyboardInterrupt:
-                    self.stop_flag = True
-            LoggingManager().log(LoggingManager.LogLevel.LOG_INFO, "Shutting down API Server.", origin=LOG_ORIGIN_API, no_print=False)
-        self.stop_flag = False
+                _LOG.log(_INFO, f"Initializing Server API Documentation on: {self.host}:{self.port}/docs/", origin=LOG_ORIGIN_API, no_print=False)
+            # Wait until the web server is stopped, waking up the main thread once a second so that a keyboard interrupt is handled on all platforms.
+            try:
+                while not self.stop_event.wait(1):
+                    pass
+            except KeyboardInterrupt:
+                self.stop_event.set()
+            _LOG.log(_INFO, "Shutting down API Server.", origin=LOG_ORIGIN_API, no_print=False)
+        self.stop_event.clear()
 
     def stop_web(self):
         """
-        Sets the stop flag for the running API server thread if the uvicorn web server is currently active.
+        Sets the stop event for the running API server thread if the uvicorn web server is currently active.
 
         :return: None
         """
         if self.web_server:
-            self.stop_flag = True
+            self.stop_event.set()